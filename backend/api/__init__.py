@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+
+from api import auth, deepdive, diff, repos, reports, user_repos
+
+# Starlette matches routes in registration order, so the report sections
+# (the bulk of traffic) are registered first.
+_ROUTERS = (
+    (reports.router, "reports"),
+    (user_repos.router, "user_repos"),
+    (repos.router, "repos"),
+    (diff.router, "diff"),
+    (deepdive.router, "deepdive"),
+    (auth.router, "auth"),
+)
+
+
+def create_api_router() -> APIRouter:
+    """Build the /api/v1 router with every feature router mounted once."""
+    api_router = APIRouter(prefix="/api/v1")
+    for router, tag in _ROUTERS:
+        api_router.include_router(router, tags=[tag])
+    return api_router
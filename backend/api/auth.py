@@ -1,11 +1,11 @@
 import secrets
 from datetime import datetime, timedelta
-from typing import TypedDict
+from typing_extensions import TypedDict
 from urllib.parse import urlencode
 
-import httpx
 import jwt
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,7 +18,9 @@ from config import (
     JWT_SECRET,
 )
 from database.connection import get_db
+from middleware.auth import bearer_scheme
 from repositories.users import UsersRepository
+from services.github_client import github_http, is_github_token_valid
 
 router = APIRouter()
 
@@ -33,12 +35,6 @@ class CallbackRequest(BaseModel):
     state: str
 
 
-class CallbackResponse(BaseModel):
-    access_token: str
-    user: UserPayload
-    expires_at: str
-
-
 class UserPayload(TypedDict):
     id: int
     login: str
@@ -47,6 +43,12 @@ class UserPayload(TypedDict):
     email: str | None
 
 
+class CallbackResponse(BaseModel):
+    access_token: str
+    user: UserPayload
+    expires_at: str
+
+
 class ValidateResponse(BaseModel):
     valid: bool
     user: UserPayload | None = None
@@ -99,55 +101,55 @@ async def github_callback(
         )
 
     # Exchange code for access token
-    async with httpx.AsyncClient() as client:
-        token_response = await client.post(
-            "https://github.com/login/oauth/access_token",
-            data={
-                "client_id": GITHUB_CLIENT_ID,
-                "client_secret": GITHUB_CLIENT_SECRET,
-                "code": payload.code,
-                "redirect_uri": f"{FRONTEND_URL}/auth/callback",
-            },
-            headers={"Accept": "application/json"},
+    token_response = await github_http.post(
+        "https://github.com/login/oauth/access_token",
+        data={
+            "client_id": GITHUB_CLIENT_ID,
+            "client_secret": GITHUB_CLIENT_SECRET,
+            "code": payload.code,
+            "redirect_uri": f"{FRONTEND_URL}/auth/callback",
+        },
+        headers={"Accept": "application/json"},
+    )
+
+    if token_response.status_code != 200:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to exchange code for token",
+        )
+
+    token_data = token_response.json()
+
+    if "error" in token_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"GitHub OAuth error: {token_data.get('error_description', 'Unknown error')}",
         )
 
-        if token_response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to exchange code for token",
-            )
-
-        token_data = token_response.json()
-
-        if "error" in token_data:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"GitHub OAuth error: {token_data.get('error_description', 'Unknown error')}",
-            )
-
-        github_token = token_data.get("access_token")
-        if not github_token:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No access token received from GitHub",
-            )
-
-        # Get user info from GitHub
-        user_response = await client.get(
-            "https://api.github.com/user",
-            headers={"Authorization": f"Bearer {github_token}"},
+    github_token = token_data.get("access_token")
+    if not github_token:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No access token received from GitHub",
         )
 
-        if user_response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to get user info from GitHub",
-            )
+    # Get user info from GitHub
+    user_response = await github_http.get(
+        "https://api.github.com/user",
+        headers={"Authorization": f"Bearer {github_token}"},
+    )
+
+    if user_response.status_code != 200:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to get user info from GitHub",
+        )
 
-        user_data = user_response.json()
+    user_data = user_response.json()
 
-        # Upsert user to database
-        users_repo = UsersRepository(db)
+    # Upsert user to database
+    users_repo = UsersRepository(db)
+    async with db.begin():
         await users_repo.get_or_create_user(
             {
                 "id": user_data["id"],
@@ -158,39 +160,39 @@ async def github_callback(
             }
         )
 
-        # Create JWT token
-        expires_at = datetime.utcnow() + timedelta(hours=JWT_EXPIRE_HOURS)
-        jwt_payload = {
-            "github_token": github_token,
-            "user": {
-                "id": user_data["id"],
-                "login": user_data["login"],
-                "name": user_data.get("name"),
-                "avatar_url": user_data.get("avatar_url"),
-                "email": user_data.get("email"),
-            },
-            "exp": expires_at,
-            "iat": datetime.utcnow(),
-        }
+    # Create JWT token
+    expires_at = datetime.utcnow() + timedelta(hours=JWT_EXPIRE_HOURS)
+    jwt_payload = {
+        "github_token": github_token,
+        "user": {
+            "id": user_data["id"],
+            "login": user_data["login"],
+            "name": user_data.get("name"),
+            "avatar_url": user_data.get("avatar_url"),
+            "email": user_data.get("email"),
+        },
+        "exp": expires_at,
+        "iat": datetime.utcnow(),
+    }
 
-        access_token = jwt.encode(jwt_payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    access_token = jwt.encode(jwt_payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
-        return CallbackResponse(
-            access_token=access_token,
-            user=jwt_payload["user"],
-            expires_at=expires_at.isoformat(),
-        )
+    return CallbackResponse(
+        access_token=access_token,
+        user=jwt_payload["user"],
+        expires_at=expires_at.isoformat(),
+    )
 
 
 @router.post("/auth/validate")
-async def validate_token(request: Request) -> ValidateResponse:
+async def validate_token(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> ValidateResponse:
     """Validate JWT token and check GitHub token is still valid"""
-    authorization = request.headers.get("Authorization")
-
-    if not authorization or not authorization.startswith("Bearer "):
+    if credentials is None:
         return ValidateResponse(valid=False)
 
-    token = authorization.replace("Bearer ", "")
+    token = credentials.credentials
 
     try:
         # Decode JWT
@@ -202,14 +204,8 @@ async def validate_token(request: Request) -> ValidateResponse:
             return ValidateResponse(valid=False)
 
         # Verify GitHub token is still valid
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.github.com/user",
-                headers={"Authorization": f"Bearer {github_token}"},
-            )
-
-            if response.status_code != 200:
-                return ValidateResponse(valid=False)
+        if not await is_github_token_valid(github_token):
+            return ValidateResponse(valid=False)
 
         expires_at = datetime.fromtimestamp(payload["exp"]).isoformat()
 
@@ -12,6 +12,7 @@ from services.deepdive_generator import generate_deep_dive
 from services.github_client import (
     get_pr_reviews,
     get_repo,
+    run_github,
 )
 from utils.url import parse_repo_url
 
@@ -31,11 +32,11 @@ async def get_deepdive(
         owner, repo_name = parse_repo_url(payload.repo_url)
         github_repo = get_repo(auth.github, owner, repo_name)
 
-        issue = await asyncio.to_thread(github_repo.get_issue, int(payload.issue))
+        issue = await run_github(github_repo.get_issue, int(payload.issue))
 
-        comments_task = asyncio.to_thread(issue.get_comments)
+        comments_task = run_github(issue.get_comments)
         reviews_task = (
-            asyncio.to_thread(get_pr_reviews, github_repo, payload.issue)
+            run_github(get_pr_reviews, github_repo, payload.issue)
             if issue.pull_request
             else asyncio.sleep(0, result=cast(PaginatedList[PullRequestReview], []))
         )
@@ -1,14 +1,17 @@
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from middleware.auth import AuthenticatedRequest, get_current_user
 from models.github import PatchItem
-from services.diff_explainer import explain_diff
+from services.diff_explainer import explain_diff, explain_diffs
 from services.github_client import get_pr_diff, get_repo
 from utils.url import parse_repo_url
 
 router = APIRouter()
 
+# Files accepted per POST /diffs; larger pull requests are explained in chunks
+MAX_DIFF_FILES = 100
+
 
 class PatchesRequest(BaseModel):
     repo_url: str
@@ -28,6 +31,14 @@ class DiffResponse(BaseModel):
     explanation: str
 
 
+class DiffsRequest(BaseModel):
+    files: list[DiffRequest] = Field(max_length=MAX_DIFF_FILES)
+
+
+class DiffsResponse(BaseModel):
+    explanations: dict[str, str]
+
+
 @router.post("/patches", response_model=PatchesResponse)
 async def get_patches(
     payload: PatchesRequest, auth: AuthenticatedRequest = Depends(get_current_user)
@@ -57,3 +68,20 @@ async def get_diff(
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to explain diff: {str(e)}")
+
+
+@router.post("/diffs", response_model=DiffsResponse)
+async def get_diffs(
+    payload: DiffsRequest, auth: AuthenticatedRequest = Depends(get_current_user)
+) -> DiffsResponse:
+    try:
+        explanations = await explain_diffs(
+            [(item.file, item.patch) for item in payload.files]
+        )
+
+        return DiffsResponse(explanations=explanations)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=400, detail=f"Failed to explain diffs: {str(e)}"
+        )
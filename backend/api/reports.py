@@ -1,19 +1,26 @@
 """Progressive report endpoints with section-level database caching."""
-from typing import Literal
+from typing import Literal, Union
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.connection import get_db
 from middleware.auth import AuthenticatedRequest, get_current_user
-from models.github import ContributorActivity, GitHubItem
+from models.github import (
+    ContributorActivity,
+    GitHubItem,
+    contributor_activity_list,
+    github_item_list,
+)
 from repositories.repositories import RepositoriesRepository
 from repositories.reports import ReportsRepository
 from repositories.user_repositories import UserRepositoriesRepository
 from services.github_client import (
     get_repo,
     get_repo_activity,
+    get_top_contributors,
     score_sort_items,
 )
 from services.issue_summary import summarize_items
@@ -21,7 +28,8 @@ from services.people_summary import (
     generate_people_summaries,
 )
 from utils.dates import resolve_timeframe
-from utils.serializers import serialize_github_item
+from utils.http_cache import etag_matches, section_cache_headers
+from utils.serializers import serialize_github_items
 
 router = APIRouter()
 
@@ -47,15 +55,16 @@ class PeopleSectionResponse(BaseModel):
     cached: bool
 
 
-@router.get("/reports/{owner}/{repo}/prs")
+@router.get("/reports/{owner}/{repo}/prs", response_model=PRsSectionResponse)
 async def get_prs_section(
     owner: str,
     repo: str,
+    response: Response,
     timeframe: Literal["last_day", "last_week", "last_month", "last_year"] = Query(...),
     force: bool = Query(False, description="Force fresh data, bypass cache"),
     auth: AuthenticatedRequest = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> PRsSectionResponse:
+) -> Union[Response, PRsSectionResponse]:
     """
     Get PRs section with database caching.
 
@@ -82,39 +91,45 @@ async def get_prs_section(
         reports_repo = ReportsRepository(db)
         user_repos_repo = UserRepositoriesRepository(db)
 
-        # Get or create repository record
-        repo_record = await repos_repo.get_or_create_repository(
-            {
-                "full_name": full_name,
-                "owner": owner,
-                "name": repo,
-                "description": github_repo.description,
-                "html_url": github_repo.html_url,
-                "is_private": github_repo.private,
-                "is_fork": github_repo.fork,
-                "is_archived": github_repo.archived,
-                "language": github_repo.language,
-                "stargazers_count": github_repo.stargazers_count,
-                "updated_at": github_repo.updated_at,
-            }
-        )
+        # Persist repository record and tracking in their own transaction
+        async with db.begin():
+            # Get or create repository record
+            repo_record = await repos_repo.get_or_create_repository(
+                {
+                    "full_name": full_name,
+                    "owner": owner,
+                    "name": repo,
+                    "description": github_repo.description,
+                    "html_url": github_repo.html_url,
+                    "is_private": github_repo.private,
+                    "is_fork": github_repo.fork,
+                    "is_archived": github_repo.archived,
+                    "language": github_repo.language,
+                    "stargazers_count": github_repo.stargazers_count,
+                    "updated_at": github_repo.updated_at,
+                }
+            )
 
-        # Ensure user is tracking this repository
-        await user_repos_repo.track_repository(auth.user["id"], repo_record.id)
+            # Ensure user is tracking this repository
+            await user_repos_repo.track_repository(auth.user_id, repo_record.id)
 
         # Check for cached PRs section (skip if force=True)
-        cached_prs = None
+        cached_prs, etag = None, ""
         if not force:
-            cached_prs = await reports_repo.get_cached_section(
+            cached_entry = await reports_repo.get_cached_section_entry(
                 repo_record.id, timeframe, "prs"
             )
+            if cached_entry is not None:
+                cached_prs, _, etag = cached_entry
 
         if cached_prs:
             print(f"✓ Cache HIT for {full_name} PRs ({timeframe})")
+            headers = section_cache_headers(etag)
+            if etag_matches(auth.headers.get("if-none-match"), headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
             # Convert dict back to GitHubItem models
-            prs_items = [
-                GitHubItem(**pr) if isinstance(pr, dict) else pr for pr in cached_prs
-            ]
+            prs_items = github_item_list.validate_python(cached_prs)
             return PRsSectionResponse(
                 prs=prs_items,
                 cached=True,
@@ -129,7 +144,7 @@ async def get_prs_section(
             auth.github, github_repo, "pr", start_date, end_date
         )
         scored_prs = score_sort_items(github_repo, prs)
-        github_prs = [serialize_github_item(pr) for _, pr in scored_prs]
+        github_prs = serialize_github_items(pr for _, pr in scored_prs)
         summarized_prs = await summarize_items(github_prs)
 
         # Store in database
@@ -139,7 +154,7 @@ async def get_prs_section(
         await reports_repo.update_section(
             report.id,
             "prs",
-            [pr.model_dump(mode="json") for pr in summarized_prs],
+            github_item_list.dump_python(summarized_prs, mode="json"),
         )
 
         # Commit immediately to ensure data is available for TL;DR endpoint
@@ -154,15 +169,16 @@ async def get_prs_section(
         raise HTTPException(status_code=400, detail=f"Failed to fetch PRs: {str(e)}")
 
 
-@router.get("/reports/{owner}/{repo}/issues")
+@router.get("/reports/{owner}/{repo}/issues", response_model=IssuesSectionResponse)
 async def get_issues_section(
     owner: str,
     repo: str,
+    response: Response,
     timeframe: Literal["last_day", "last_week", "last_month", "last_year"] = Query(...),
     force: bool = Query(False, description="Force fresh data, bypass cache"),
     auth: AuthenticatedRequest = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> IssuesSectionResponse:
+) -> Union[Response, IssuesSectionResponse]:
     """
     Get Issues section with database caching.
 
@@ -189,40 +205,45 @@ async def get_issues_section(
         reports_repo = ReportsRepository(db)
         user_repos_repo = UserRepositoriesRepository(db)
 
-        # Get or create repository record
-        repo_record = await repos_repo.get_or_create_repository(
-            {
-                "full_name": full_name,
-                "owner": owner,
-                "name": repo,
-                "description": github_repo.description,
-                "html_url": github_repo.html_url,
-                "is_private": github_repo.private,
-                "is_fork": github_repo.fork,
-                "is_archived": github_repo.archived,
-                "language": github_repo.language,
-                "stargazers_count": github_repo.stargazers_count,
-                "updated_at": github_repo.updated_at,
-            }
-        )
+        # Persist repository record and tracking in their own transaction
+        async with db.begin():
+            # Get or create repository record
+            repo_record = await repos_repo.get_or_create_repository(
+                {
+                    "full_name": full_name,
+                    "owner": owner,
+                    "name": repo,
+                    "description": github_repo.description,
+                    "html_url": github_repo.html_url,
+                    "is_private": github_repo.private,
+                    "is_fork": github_repo.fork,
+                    "is_archived": github_repo.archived,
+                    "language": github_repo.language,
+                    "stargazers_count": github_repo.stargazers_count,
+                    "updated_at": github_repo.updated_at,
+                }
+            )
 
-        # Ensure user is tracking this repository
-        await user_repos_repo.track_repository(auth.user["id"], repo_record.id)
+            # Ensure user is tracking this repository
+            await user_repos_repo.track_repository(auth.user_id, repo_record.id)
 
         # Check for cached Issues section (skip if force=True)
-        cached_issues = None
+        cached_issues, etag = None, ""
         if not force:
-            cached_issues = await reports_repo.get_cached_section(
+            cached_entry = await reports_repo.get_cached_section_entry(
                 repo_record.id, timeframe, "issues"
             )
+            if cached_entry is not None:
+                cached_issues, _, etag = cached_entry
 
         if cached_issues:
             print(f"✓ Cache HIT for {full_name} Issues ({timeframe})")
+            headers = section_cache_headers(etag)
+            if etag_matches(auth.headers.get("if-none-match"), headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
             # Convert dict back to GitHubItem models
-            issues_items = [
-                GitHubItem(**issue) if isinstance(issue, dict) else issue
-                for issue in cached_issues
-            ]
+            issues_items = github_item_list.validate_python(cached_issues)
             return IssuesSectionResponse(
                 issues=issues_items,
                 cached=True,
@@ -237,7 +258,7 @@ async def get_issues_section(
             auth.github, github_repo, "issue", start_date, end_date
         )
         scored_issues = score_sort_items(github_repo, issues)
-        github_issues = [serialize_github_item(issue) for _, issue in scored_issues]
+        github_issues = serialize_github_items(issue for _, issue in scored_issues)
         summarized_issues = await summarize_items(github_issues)
 
         # Store in database
@@ -247,7 +268,7 @@ async def get_issues_section(
         await reports_repo.update_section(
             report.id,
             "issues",
-            [issue.model_dump(mode="json") for issue in summarized_issues],
+            github_item_list.dump_python(summarized_issues, mode="json"),
         )
 
         # Commit immediately to ensure data is available for TL;DR endpoint
@@ -262,15 +283,16 @@ async def get_issues_section(
         raise HTTPException(status_code=400, detail=f"Failed to fetch Issues: {str(e)}")
 
 
-@router.get("/reports/{owner}/{repo}/people")
+@router.get("/reports/{owner}/{repo}/people", response_model=PeopleSectionResponse)
 async def get_people_section(
     owner: str,
     repo: str,
+    response: Response,
     timeframe: Literal["last_day", "last_week", "last_month", "last_year"] = Query(...),
     force: bool = Query(False, description="Force fresh data, bypass cache"),
     auth: AuthenticatedRequest = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> PeopleSectionResponse:
+) -> Union[Response, PeopleSectionResponse]:
     """
     Get People (contributors) section with database caching.
 
@@ -297,37 +319,45 @@ async def get_people_section(
         reports_repo = ReportsRepository(db)
         user_repos_repo = UserRepositoriesRepository(db)
 
-        # Get or create repository record
-        repo_record = await repos_repo.get_or_create_repository(
-            {
-                "full_name": full_name,
-                "owner": owner,
-                "name": repo,
-                "description": github_repo.description,
-                "html_url": github_repo.html_url,
-                "is_private": github_repo.private,
-                "is_fork": github_repo.fork,
-                "is_archived": github_repo.archived,
-                "language": github_repo.language,
-                "stargazers_count": github_repo.stargazers_count,
-                "updated_at": github_repo.updated_at,
-            }
-        )
+        # Persist repository record and tracking in their own transaction
+        async with db.begin():
+            # Get or create repository record
+            repo_record = await repos_repo.get_or_create_repository(
+                {
+                    "full_name": full_name,
+                    "owner": owner,
+                    "name": repo,
+                    "description": github_repo.description,
+                    "html_url": github_repo.html_url,
+                    "is_private": github_repo.private,
+                    "is_fork": github_repo.fork,
+                    "is_archived": github_repo.archived,
+                    "language": github_repo.language,
+                    "stargazers_count": github_repo.stargazers_count,
+                    "updated_at": github_repo.updated_at,
+                }
+            )
 
-        # Ensure user is tracking this repository
-        await user_repos_repo.track_repository(auth.user["id"], repo_record.id)
+            # Ensure user is tracking this repository
+            await user_repos_repo.track_repository(auth.user_id, repo_record.id)
 
         # Check for cached People section (skip if force=True)
-        cached_people = None
+        cached_people, etag = None, ""
         if not force:
-            cached_people = await reports_repo.get_cached_section(
+            cached_entry = await reports_repo.get_cached_section_entry(
                 repo_record.id, timeframe, "people"
             )
+            if cached_entry is not None:
+                cached_people, _, etag = cached_entry
 
         if cached_people:
             print(f"✓ Cache HIT for {full_name} People ({timeframe})")
+            headers = section_cache_headers(etag)
+            if etag_matches(auth.headers.get("if-none-match"), headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
             return PeopleSectionResponse(
-                people=cached_people,
+                people=contributor_activity_list.validate_python(cached_people),
                 cached=True,
             )
 
@@ -339,37 +369,36 @@ async def get_people_section(
 
         # Get PRs and Issues for contributor analysis
         # Check cache first to avoid regenerating (skip expiration check since we need the data)
-        cached_prs_data = await reports_repo.get_cached_section(
-            repo_record.id, timeframe, "prs", skip_expiration_check=True
-        )
-        cached_issues_data = await reports_repo.get_cached_section(
-            repo_record.id, timeframe, "issues", skip_expiration_check=True
+        cached_sections = await reports_repo.get_cached_sections(
+            repo_record.id, timeframe, ("prs", "issues"), skip_expiration_check=True
         )
+        cached_prs_data = cached_sections["prs"]
+        cached_issues_data = cached_sections["issues"]
 
         if cached_prs_data and cached_issues_data:
             # Use cached data
-            prs_list = [
-                GitHubItem(**pr) if isinstance(pr, dict) else pr
-                for pr in cached_prs_data
-            ]
-            issues_list = [
-                GitHubItem(**issue) if isinstance(issue, dict) else issue
-                for issue in cached_issues_data
-            ]
+            prs_list = github_item_list.validate_python(cached_prs_data)
+            issues_list = github_item_list.validate_python(cached_issues_data)
         else:
             # Generate fresh (this shouldn't happen often if frontend calls in order)
-            prs = await get_repo_activity(
-                auth.github, github_repo, "pr", start_date, end_date
+            # One search for both PRs and issues, split locally
+            top_contributors = set(get_top_contributors(github_repo))
+            items = await get_repo_activity(
+                auth.github, github_repo, "all", start_date, end_date
             )
-            scored_prs = score_sort_items(github_repo, prs)
-            github_prs = [serialize_github_item(pr) for _, pr in scored_prs]
+            prs = [item for item in items if item.pull_request is not None]
+            issues = [item for item in items if item.pull_request is None]
+
+            scored_prs = score_sort_items(
+                github_repo, prs, top_contributors=top_contributors
+            )
+            github_prs = serialize_github_items(pr for _, pr in scored_prs)
             prs_list = await summarize_items(github_prs)
 
-            issues = await get_repo_activity(
-                auth.github, github_repo, "issue", start_date, end_date
+            scored_issues = score_sort_items(
+                github_repo, issues, top_contributors=top_contributors
             )
-            scored_issues = score_sort_items(github_repo, issues)
-            github_issues = [serialize_github_item(issue) for _, issue in scored_issues]
+            github_issues = serialize_github_items(issue for _, issue in scored_issues)
             issues_list = await summarize_items(github_issues)
 
         # Generate people summaries
@@ -389,7 +418,7 @@ async def get_people_section(
         await db.commit()
 
         return PeopleSectionResponse(
-            people=people_summaries,
+            people=contributor_activity_list.validate_python(people_summaries),
             cached=False,
         )
 
@@ -434,25 +463,27 @@ async def get_tldr_section(
             reports_repo = ReportsRepository(db)
             user_repos_repo = UserRepositoriesRepository(db)
 
-            # Get or create repository record
-            repo_record = await repos_repo.get_or_create_repository(
-                {
-                    "full_name": full_name,
-                    "owner": owner,
-                    "name": repo,
-                    "description": github_repo.description,
-                    "html_url": github_repo.html_url,
-                    "is_private": github_repo.private,
-                    "is_fork": github_repo.fork,
-                    "is_archived": github_repo.archived,
-                    "language": github_repo.language,
-                    "stargazers_count": github_repo.stargazers_count,
-                    "updated_at": github_repo.updated_at,
-                }
-            )
+            # Persist repository record and tracking in their own transaction
+            async with db.begin():
+                # Get or create repository record
+                repo_record = await repos_repo.get_or_create_repository(
+                    {
+                        "full_name": full_name,
+                        "owner": owner,
+                        "name": repo,
+                        "description": github_repo.description,
+                        "html_url": github_repo.html_url,
+                        "is_private": github_repo.private,
+                        "is_fork": github_repo.fork,
+                        "is_archived": github_repo.archived,
+                        "language": github_repo.language,
+                        "stargazers_count": github_repo.stargazers_count,
+                        "updated_at": github_repo.updated_at,
+                    }
+                )
 
-            # Ensure user is tracking this repository
-            await user_repos_repo.track_repository(auth.user["id"], repo_record.id)
+                # Ensure user is tracking this repository
+                await user_repos_repo.track_repository(auth.user_id, repo_record.id)
 
             # Check for cached TL;DR section (skip if force=True)
             cached_tldr = None
@@ -461,7 +492,8 @@ async def get_tldr_section(
                     repo_record.id, timeframe, "tldr"
                 )
 
-            if cached_tldr:
+            # The TL;DR section is always stored as plain text
+            if isinstance(cached_tldr, str) and cached_tldr:
                 print(f"✓ Cache HIT for {full_name} TL;DR ({timeframe})")
                 # Stream cached text in small chunks for smooth UX
                 chunk_size = 50
@@ -477,26 +509,22 @@ async def get_tldr_section(
 
             # Get PRs and Issues summaries (we need these to generate TL;DR)
             # Skip expiration check since we need the data regardless
-            cached_prs_data = await reports_repo.get_cached_section(
-                repo_record.id, timeframe, "prs", skip_expiration_check=True
-            )
-            cached_issues_data = await reports_repo.get_cached_section(
-                repo_record.id, timeframe, "issues", skip_expiration_check=True
+            cached_sections = await reports_repo.get_cached_sections(
+                repo_record.id,
+                timeframe,
+                ("prs", "issues"),
+                skip_expiration_check=True,
             )
+            cached_prs_data = cached_sections["prs"]
+            cached_issues_data = cached_sections["issues"]
 
             if cached_prs_data is None or cached_issues_data is None:
                 yield "⚠️ Error: PRs and Issues must be loaded before generating TL;DR"
                 return
 
             # Extract summaries from cached data
-            prs_list = [
-                GitHubItem(**pr) if isinstance(pr, dict) else pr
-                for pr in cached_prs_data
-            ]
-            issues_list = [
-                GitHubItem(**issue) if isinstance(issue, dict) else issue
-                for issue in cached_issues_data
-            ]
+            prs_list = github_item_list.validate_python(cached_prs_data)
+            issues_list = github_item_list.validate_python(cached_issues_data)
 
             summaries = [
                 *[pr.summary for pr in prs_list if pr.summary],
@@ -1,14 +1,19 @@
 """User repository tracking API endpoints."""
+from datetime import datetime, timezone
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.connection import get_db
+from database.models import Repository
 from middleware.auth import AuthenticatedRequest, get_current_user
-from repositories.repositories import RepositoriesRepository
-from repositories.user_repositories import UserRepositoriesRepository
+from repositories.repositories import REPOSITORY_METADATA_TTL, RepositoriesRepository
+from repositories.user_repositories import (
+    UserRepositoriesRepository,
+    tracked_repositories_cache,
+)
 from services.github_client import get_repo
 from utils.url import parse_repo_url
 
@@ -18,12 +23,16 @@ router = APIRouter()
 class TrackRepoRequest(BaseModel):
     """Request to track a repository."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     repo_url: str
 
 
 class RepositorySummary(BaseModel):
     """Summary of repository data."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: int
     full_name: str
     owner: str
@@ -38,6 +47,8 @@ class RepositorySummary(BaseModel):
 class TrackRepoResponse(BaseModel):
     """Response after tracking a repository."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     message: str
     repository: RepositorySummary
@@ -46,12 +57,16 @@ class TrackRepoResponse(BaseModel):
 class UntrackRepoRequest(BaseModel):
     """Request to untrack a repository."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     repo_url: str
 
 
 class UntrackRepoResponse(BaseModel):
     """Response after untracking a repository."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     message: str
 
@@ -59,40 +74,93 @@ class UntrackRepoResponse(BaseModel):
 class UserReposResponse(BaseModel):
     """Response with user's tracked repositories."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     repositories: List[RepositorySummary]
+    next_cursor: int | None = None
+
+
+class UserReposCountResponse(BaseModel):
+    """Number of repositories tracked by the user."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    count: int
+
+
+def _repository_summary(repo: Repository) -> RepositorySummary:
+    """Build a RepositorySummary from a trusted database row (no validation)."""
+    return RepositorySummary.model_construct(
+        id=repo.id,
+        full_name=repo.full_name,
+        owner=repo.owner,
+        name=repo.name,
+        description=repo.description,
+        html_url=repo.html_url,
+        is_private=repo.is_private,
+        language=repo.language,
+        stargazers_count=repo.stargazers_count,
+    )
 
 
-@router.get("/users/me/repositories")
+def _is_fresh_public_repository(repo: Repository) -> bool:
+    """Whether a cached repository row can be tracked without asking GitHub.
+
+    Private repositories always go through GitHub so access is re-checked
+    for the requesting user.
+    """
+    if repo.is_private or repo.last_synced_at is None:
+        return False
+    return datetime.now(timezone.utc) - repo.last_synced_at < REPOSITORY_METADATA_TTL
+
+
+@router.get("/users/me/repositories", response_model=UserReposResponse)
 async def get_user_repositories(
+    limit: int | None = Query(None, ge=1, le=200, description="Page size"),
+    cursor: int | None = Query(None, description="next_cursor of previous page"),
     auth: AuthenticatedRequest = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> UserReposResponse:
+) -> Response:
     """
-    Get all repositories tracked by the current user.
+    Get repositories tracked by the current user, most recently tracked first.
+
+    Without `limit` the full list is returned. With `limit`, results are paged
+    and `next_cursor` is set while more pages remain.
 
     Returns:
         UserReposResponse: List of tracked repositories
     """
     try:
+        user_id = auth.user_id
+        paginated = limit is not None or cursor is not None
+
+        if not paginated:
+            cached = tracked_repositories_cache.get(user_id)
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+
         user_repos_repo = UserRepositoriesRepository(db)
-        repositories = await user_repos_repo.get_user_repositories(auth.user["id"])
-
-        return UserReposResponse(
-            repositories=[
-                RepositorySummary(
-                    id=repo.id,
-                    full_name=repo.full_name,
-                    owner=repo.owner,
-                    name=repo.name,
-                    description=repo.description,
-                    html_url=repo.html_url,
-                    is_private=repo.is_private,
-                    language=repo.language,
-                    stargazers_count=repo.stargazers_count,
-                )
-                for repo in repositories
-            ]
+        next_cursor = None
+        if paginated:
+            (
+                repositories,
+                next_cursor,
+            ) = await user_repos_repo.get_user_repositories_page(
+                user_id, limit or 50, cursor
+            )
+        else:
+            repositories = await user_repos_repo.get_user_repositories(user_id)
+
+        # Serialize straight to JSON bytes; rows come from our own database so
+        # there is nothing to validate, and FastAPI's encoder pass is skipped
+        response = UserReposResponse.model_construct(
+            repositories=[_repository_summary(repo) for repo in repositories],
+            next_cursor=next_cursor,
         )
+        content = response.model_dump_json().encode()
+        if not paginated:
+            tracked_repositories_cache.set(user_id, content)
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -100,6 +168,28 @@ async def get_user_repositories(
         )
 
 
+@router.get("/users/me/repositories/count")
+async def count_user_repositories(
+    auth: AuthenticatedRequest = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> UserReposCountResponse:
+    """
+    Count repositories tracked by the current user without loading them.
+
+    Returns:
+        UserReposCountResponse: Number of tracked repositories
+    """
+    try:
+        user_repos_repo = UserRepositoriesRepository(db)
+        count = await user_repos_repo.count_user_repositories(auth.user_id)
+        return UserReposCountResponse(count=count)
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to count tracked repositories: {str(e)}",
+        )
+
+
 @router.post("/users/me/repositories")
 async def track_repository(
     payload: TrackRepoRequest,
@@ -114,55 +204,69 @@ async def track_repository(
 
     Returns:
         TrackRepoResponse: Success status and repository info
+
+    Raises:
+        HTTPException: 409 if the user already tracks the repository
     """
     try:
         # Parse repository URL
         owner, repo_name = parse_repo_url(payload.repo_url)
         full_name = f"{owner}/{repo_name}"
 
-        # Get repository from GitHub to validate it exists
-        github_repo = get_repo(auth.github, owner, repo_name)
-
         # Initialize repositories
         repos_repo = RepositoriesRepository(db)
         user_repos_repo = UserRepositoriesRepository(db)
 
-        # Get or create repository record
-        repo_record = await repos_repo.get_or_create_repository(
-            {
-                "full_name": full_name,
-                "owner": owner,
-                "name": repo_name,
-                "description": github_repo.description,
-                "html_url": github_repo.html_url,
-                "is_private": github_repo.private,
-                "is_fork": github_repo.fork,
-                "is_archived": github_repo.archived,
-                "language": github_repo.language,
-                "stargazers_count": github_repo.stargazers_count,
-                "updated_at": github_repo.updated_at,
-            }
-        )
+        # Serve idempotent re-tracks and fresh public repos from the database
+        async with db.begin():
+            repo_record = await repos_repo.get_by_full_name(full_name)
+
+            if repo_record and await user_repos_repo.is_tracking(
+                auth.user_id, repo_record.id
+            ):
+                raise HTTPException(
+                    status_code=409, detail=f"Already tracking {full_name}"
+                )
+
+            if repo_record and _is_fresh_public_repository(repo_record):
+                await user_repos_repo.track_repository(auth.user_id, repo_record.id)
+            else:
+                repo_record = None
+
+        if repo_record is None:
+            # Get repository from GitHub to validate it exists (and that the
+            # user can see it, for private repositories)
+            github_repo = get_repo(auth.github, owner, repo_name)
+
+            async with db.begin():
+                # Get or create repository record
+                repo_record = await repos_repo.get_or_create_repository(
+                    {
+                        "full_name": full_name,
+                        "owner": owner,
+                        "name": repo_name,
+                        "description": github_repo.description,
+                        "html_url": github_repo.html_url,
+                        "is_private": github_repo.private,
+                        "is_fork": github_repo.fork,
+                        "is_archived": github_repo.archived,
+                        "language": github_repo.language,
+                        "stargazers_count": github_repo.stargazers_count,
+                        "updated_at": github_repo.updated_at,
+                    }
+                )
 
-        # Track repository for user
-        await user_repos_repo.track_repository(auth.user["id"], repo_record.id)
+                # Track repository for user
+                await user_repos_repo.track_repository(auth.user_id, repo_record.id)
 
         return TrackRepoResponse(
             success=True,
             message=f"Successfully tracking {full_name}",
-            repository=RepositorySummary(
-                id=repo_record.id,
-                full_name=repo_record.full_name,
-                owner=repo_record.owner,
-                name=repo_record.name,
-                description=repo_record.description,
-                html_url=repo_record.html_url,
-                is_private=repo_record.is_private,
-                language=repo_record.language,
-                stargazers_count=repo_record.stargazers_count,
-            ),
+            repository=_repository_summary(repo_record),
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=400, detail=f"Failed to track repository: {str(e)}"
@@ -193,18 +297,19 @@ async def untrack_repository(
         repos_repo = RepositoriesRepository(db)
         user_repos_repo = UserRepositoriesRepository(db)
 
-        # Get repository record
-        repo_record = await repos_repo.get_by_full_name(full_name)
+        async with db.begin():
+            # Get repository record
+            repo_record = await repos_repo.get_by_full_name(full_name)
 
-        if not repo_record:
-            raise HTTPException(
-                status_code=404, detail=f"Repository {full_name} not found"
-            )
+            if not repo_record:
+                raise HTTPException(
+                    status_code=404, detail=f"Repository {full_name} not found"
+                )
 
-        # Untrack repository for user
-        success = await user_repos_repo.untrack_repository(
-            auth.user["id"], repo_record.id
-        )
+            # Untrack repository for user
+            success = await user_repos_repo.untrack_repository(
+                auth.user_id, repo_record.id
+            )
 
         if not success:
             return UntrackRepoResponse(
@@ -1,10 +1,20 @@
 """Database connection setup and session management."""
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
+import asyncpg
+import orjson
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
-from config import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT
+from config import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_READ_POOL_SIZE,
+)
 
 # Create async engine
 engine = create_async_engine(
@@ -12,6 +22,12 @@ engine = create_async_engine(
     pool_size=DB_POOL_SIZE,
     max_overflow=DB_MAX_OVERFLOW,
     pool_timeout=DB_POOL_TIMEOUT,
+    # Replace connections before server/proxy idle timeouts can kill them, and
+    # ping on checkout so a restarted database costs a reconnect, not a 500
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    # Reuse the most recently returned connection so idle ones can age out
+    pool_use_lifo=True,
     echo=False,  # Set to True for SQL query logging
     future=True,
 )
@@ -28,21 +44,27 @@ AsyncSessionLocal = async_sessionmaker(
 # Base class for ORM models
 Base = declarative_base()
 
+# Raw asyncpg pool for hot single-row reads that skip the ORM; set up in lifespan
+_pg_pool: Optional[asyncpg.Pool] = None
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency injection function to get database session.
 
+    The session is not committed on the way out, so read-only endpoints never
+    pay for a COMMIT round-trip. Endpoints that write own their transaction:
+
     Usage in FastAPI:
-        @app.get("/endpoint")
+        @app.post("/endpoint")
         async def endpoint(db: AsyncSession = Depends(get_db)):
-            # Use db session
-            pass
+            async with db.begin():
+                # Writes committed when the block exits
+                pass
     """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -59,3 +81,43 @@ async def init_db() -> None:
 async def close_db() -> None:
     """Close database connection pool."""
     await engine.dispose()
+
+
+async def _init_pg_connection(conn: asyncpg.Connection) -> None:
+    """Decode json/jsonb columns to Python objects (asyncpg returns str)."""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=lambda value: orjson.dumps(value).decode(),
+            decoder=orjson.loads,
+            schema="pg_catalog",
+        )
+
+
+async def init_pg_pool() -> None:
+    """Create the raw asyncpg pool used by read-only hot paths."""
+    global _pg_pool
+    # asyncpg wants a plain postgresql:// DSN, not the SQLAlchemy driver URL
+    dsn = make_url(DATABASE_URL).set(drivername="postgresql")
+    _pg_pool = await asyncpg.create_pool(
+        dsn.render_as_string(hide_password=False),
+        # Its own small budget: these connections come on top of the
+        # SQLAlchemy pool's DB_POOL_SIZE + DB_MAX_OVERFLOW
+        min_size=min(2, DB_READ_POOL_SIZE),
+        max_size=DB_READ_POOL_SIZE,
+        statement_cache_size=1024,
+        init=_init_pg_connection,
+    )
+
+
+def get_pg_pool() -> Optional[asyncpg.Pool]:
+    """Return the asyncpg pool, or None if it has not been initialized."""
+    return _pg_pool
+
+
+async def close_pg_pool() -> None:
+    """Close the asyncpg pool."""
+    global _pg_pool
+    if _pg_pool is not None:
+        await _pg_pool.close()
+        _pg_pool = None
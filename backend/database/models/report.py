@@ -4,10 +4,18 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from database.connection import Base
 
@@ -28,6 +36,13 @@ class Report(Base):
         UniqueConstraint(
             "repository_id", "timeframe", "timeframe_start", "timeframe_end"
         ),
+        # Serves "latest report for repo + timeframe" lookups without a sort
+        Index(
+            "idx_reports_repo_timeframe_created",
+            "repository_id",
+            "timeframe",
+            text("created_at DESC"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -17,7 +17,8 @@ class Repository(Base):
     __tablename__ = "repositories"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    full_name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    # Uniqueness is case-insensitive, see ux_repositories_full_name_lower below
+    full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     owner: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
@@ -30,6 +31,8 @@ class Repository(Base):
     github_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    # Last time the metadata above was fetched from GitHub, changed or not
+    last_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     reports: Mapped[list["Report"]] = relationship(
@@ -37,4 +40,13 @@ class Repository(Base):
     )
     tracked_by: Mapped[list["UserRepository"]] = relationship(
         "UserRepository", back_populates="repository", cascade="all, delete-orphan"
-    )
\ No newline at end of file
+    )
+
+
+# GitHub treats owner/repo as case-insensitive; one row per repository whatever
+# casing the URL used, and the lookup in get_by_full_name can use this index
+Index(
+    "ux_repositories_full_name_lower",
+    func.lower(Repository.full_name),
+    unique=True,
+)
@@ -4,9 +4,16 @@ from __future__ import annotations
 from datetime import datetime
 
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from database.connection import Base
 
@@ -15,7 +22,18 @@ class UserRepository(Base):
     """User-Repository tracking (many-to-many relationship)."""
 
     __tablename__ = "user_repositories"
-    __table_args__ = (UniqueConstraint("user_id", "repository_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "repository_id"),
+        # Covers "repos tracked by user X, newest first" (and its keyset
+        # pagination on id) as an index-only scan
+        Index(
+            "idx_user_repositories_user_recent",
+            "user_id",
+            text("id DESC"),
+            postgresql_include=["repository_id"],
+        ),
+        Index("idx_user_repositories_repository_id", "repository_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(
@@ -14,7 +14,7 @@ CREATE INDEX idx_users_login ON users(login);
 -- Repositories table (cached GitHub repository metadata)
 CREATE TABLE repositories (
     id SERIAL PRIMARY KEY,
-    full_name VARCHAR(255) NOT NULL UNIQUE,   -- "owner/repo" (unique identifier)
+    full_name VARCHAR(255) NOT NULL,          -- "owner/repo" (unique, case-insensitive)
     owner VARCHAR(255) NOT NULL,              -- Repository owner username/org
     name VARCHAR(255) NOT NULL,               -- Repository name
     description TEXT,                         -- Repository description
@@ -25,11 +25,13 @@ CREATE TABLE repositories (
     language VARCHAR(100),                    -- Primary programming language
     stargazers_count INTEGER DEFAULT 0,       -- Star count (cached)
     github_updated_at TIMESTAMP WITH TIME ZONE,  -- Last update on GitHub
+    last_synced_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),  -- Last metadata fetch from GitHub
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
-CREATE INDEX idx_repositories_full_name ON repositories(full_name);
+-- GitHub owner/repo names are case-insensitive
+CREATE UNIQUE INDEX ux_repositories_full_name_lower ON repositories(LOWER(full_name));
 CREATE INDEX idx_repositories_owner ON repositories(owner);
 
 -- User-Repository tracking (many-to-many relationship)
@@ -41,7 +43,11 @@ CREATE TABLE user_repositories (
     UNIQUE(user_id, repository_id)
 );
 
-CREATE INDEX idx_user_repositories_user_id ON user_repositories(user_id);
+-- Covering index for "repos tracked by user X, newest first" and its keyset
+-- pagination on id (index-only scan); plain user_id lookups are already served
+-- by the UNIQUE(user_id, repository_id) index
+CREATE INDEX idx_user_repositories_user_recent
+    ON user_repositories(user_id, id DESC) INCLUDE (repository_id);
 CREATE INDEX idx_user_repositories_repository_id ON user_repositories(repository_id);
 
 -- TL;DR Reports (shared across users)
@@ -77,7 +83,10 @@ CREATE TABLE reports (
     UNIQUE(repository_id, timeframe, timeframe_start, timeframe_end)
 );
 
-CREATE INDEX idx_reports_repository_id ON reports(repository_id);
+-- "Latest report for repo + timeframe" (every section cache lookup); its
+-- repository_id prefix also serves lookups and cascades by repository alone
+CREATE INDEX idx_reports_repo_timeframe_created
+    ON reports(repository_id, timeframe, created_at DESC);
 CREATE INDEX idx_reports_timeframe ON reports(timeframe);
 
 -- GIN index for JSONB queries (optional, for future features)
@@ -2,35 +2,48 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import os
 
-from api import (
-    auth,
-    deepdive,
-    diff,
-    repos,
-    reports,
-    user_repos,
-)
-from database.connection import init_db, close_db
+from api import create_api_router
+from config import LOG_LEVEL
+from database.connection import close_db, close_pg_pool, init_db, init_pg_pool
+from services.github_client import close_github_http
+from services.openai_client import close_openai
+from utils.log_queue import start_log_queue
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # type: ignore
     """Manage application lifecycle (database connection)."""
-    # Startup: Initialize database connection
+    # Startup: Move log I/O off the event loop, then connect the database
+    log_listener = start_log_queue(LOG_LEVEL)
     await init_db()
+    await init_pg_pool()
     yield
-    # Shutdown: Close database connection
+    # Shutdown: Close database connections and outbound HTTP pools
+    await close_pg_pool()
     await close_db()
+    await close_github_http()
+    await close_openai()
+    log_listener.stop()
 
 
-app = FastAPI(title="OSS TL;DR Backend", lifespan=lifespan)
+# orjson renders the large report payloads several times faster than json.dumps
+app = FastAPI(
+    title="OSS TL;DR Backend",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Configure CORS
-allowed_origins = os.getenv(
-    "ALLOWED_ORIGINS", "http://localhost:5173,http://localhost:3000"
-).split(",")
+allowed_origins = [
+    origin.strip()
+    for origin in os.getenv(
+        "ALLOWED_ORIGINS", "http://localhost:5173,http://localhost:3000"
+    ).split(",")
+    if origin.strip()
+]
 
 app.add_middleware(
     CORSMiddleware,
@@ -38,6 +51,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 
@@ -46,10 +60,4 @@ def health_check() -> dict[str, str]:
     return {"status": "ok", "message": "OSS TL;DR is alive!"}
 
 
-# Include routers
-app.include_router(auth.router, prefix="/api/v1", tags=["auth"])
-app.include_router(diff.router, prefix="/api/v1", tags=["diff"])
-app.include_router(deepdive.router, prefix="/api/v1", tags=["deepdive"])
-app.include_router(repos.router, prefix="/api/v1", tags=["repos"])
-app.include_router(reports.router, prefix="/api/v1", tags=["reports"])
-app.include_router(user_repos.router, prefix="/api/v1", tags=["user_repos"])
+app.include_router(create_api_router())
@@ -1,15 +1,62 @@
-import jwt
+import time
+from hashlib import blake2b
 from typing import Any
-from fastapi import HTTPException, Request, status
+
+import jwt
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from github import Github
+from starlette.datastructures import URL, Address, Headers, QueryParams, State
+from starlette.types import Scope
 
 from config import JWT_ALGORITHM, JWT_SECRET
+from utils.cache import TTLCache
+
+# JWT verifier built once: options, key bytes and algorithm list are not
+# re-created on every decode
+_jwt = jwt.PyJWT(options={"require": ["exp"]})
+_JWT_KEY = JWT_SECRET.encode()
+_JWT_ALGORITHMS = (JWT_ALGORITHM,)
+
+# Parses "Authorization: Bearer <token>"; missing or malformed headers are
+# reported by get_current_user so the 401 detail stays the same
+bearer_scheme = HTTPBearer(auto_error=False)
+
+# PyGithub clients keyed by a GitHub token fingerprint, so requests from the
+# same user reuse one pooled requests.Session (and its TLS connections) instead
+# of building a new client per request. Clients leaving the cache are closed so
+# their pooled sockets are released right away.
+_github_clients: TTLCache[bytes, Github] = TTLCache(
+    maxsize=512, ttl=30 * 60, on_evict=Github.close
+)
+
+
+# Verified JWT claims keyed by a token fingerprint: (github_token, user, exp).
+# SPAs resend the same bearer token on every call, so the HMAC check and JSON
+# parse only need to run once per token per TTL.
+_verified_tokens: TTLCache[
+    bytes, tuple[str, dict[str, str | int | None], float]
+] = TTLCache(maxsize=10_000, ttl=300)
+
+
+def get_github_client(github_token: str) -> Github:
+    """Return the shared GitHub client for a token, creating it on first use."""
+    token_key = blake2b(github_token.encode(), digest_size=16).digest()
+    client = _github_clients.get(token_key)
+    if client is None:
+        client = Github(github_token, per_page=100, pool_size=10)
+        _github_clients.set(token_key, client)
+    return client
 
 
 class AuthenticatedRequest:
     """Enhanced request object with authentication data"""
 
-    def __init__(self, request: Request, github_token: str, user: dict[str, str | int | None]):
+    __slots__ = ("request", "github_token", "user", "_github_client")
+
+    def __init__(
+        self, request: Request, github_token: str, user: dict[str, str | int | None]
+    ):
         """
         Initialize authenticated request.
         """
@@ -22,30 +69,82 @@ class AuthenticatedRequest:
     def github(self) -> Github:
         """Get authenticated GitHub client for this user"""
         if self._github_client is None:
-            self._github_client = Github(self.github_token)
+            self._github_client = get_github_client(self.github_token)
         return self._github_client
 
-    def __getattr__(self, name: str) -> Any:
-        """Delegate other attributes to the original request"""
-        return getattr(self.request, name)
+    @property
+    def user_id(self) -> int:
+        """Database ID of the authenticated user."""
+        user_id = self.user["id"]
+        if user_id is None:
+            raise ValueError("Token carries no user ID")
+        return int(user_id)
+
+    # Commonly used request attributes, forwarded explicitly; anything else is
+    # available through `.request`
+    @property
+    def scope(self) -> Scope:
+        return self.request.scope
 
+    @property
+    def method(self) -> str:
+        return self.request.method
 
-def get_current_user(request: Request) -> AuthenticatedRequest:
-    """Extract and validate JWT token from request headers"""
-    authorization = request.headers.get("Authorization")
+    @property
+    def url(self) -> URL:
+        return self.request.url
 
-    if not authorization or not authorization.startswith("Bearer "):
+    @property
+    def headers(self) -> Headers:
+        return self.request.headers
+
+    @property
+    def query_params(self) -> QueryParams:
+        return self.request.query_params
+
+    @property
+    def path_params(self) -> dict[str, Any]:
+        return self.request.path_params
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        return self.request.cookies
+
+    @property
+    def client(self) -> Address | None:
+        return self.request.client
+
+    @property
+    def state(self) -> State:
+        return self.request.state
+
+
+def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> AuthenticatedRequest:
+    """Extract and validate JWT token from the Bearer authorization header"""
+    if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing or invalid authorization header",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token = authorization.replace("Bearer ", "")
+    token = credentials.credentials
+
+    # Fast path: token already verified and not yet expired
+    token_key = blake2b(token.encode(), digest_size=16).digest()
+    cached = _verified_tokens.get(token_key)
+    if cached is not None:
+        github_token, user, expires_at = cached
+        if expires_at > time.time():
+            return AuthenticatedRequest(request, github_token, user)
+        _verified_tokens.pop(token_key)
 
     try:
         # Decode JWT
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = _jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         github_token = payload.get("github_token")
         user = payload.get("user")
 
@@ -56,8 +155,16 @@ def get_current_user(request: Request) -> AuthenticatedRequest:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        expires_at = float(payload["exp"])
+        _verified_tokens.set(
+            token_key,
+            (github_token, user, expires_at),
+            ttl=min(_verified_tokens.ttl, expires_at - time.time()),
+        )
         return AuthenticatedRequest(request, github_token, user)
 
+    except HTTPException:
+        raise
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,17 +1,35 @@
+import sys
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Iterable, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, BeforeValidator, ConfigDict, TypeAdapter
+
+
+def intern_labels(labels: Iterable[str]) -> tuple[str, ...]:
+    # Label names repeat across every item of a repo; share one string each
+    return tuple(sys.intern(label) for label in labels)
+
+
+def intern_optional(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+Labels = Annotated[tuple[str, ...], BeforeValidator(intern_labels)]
+InternedStr = Annotated[str, BeforeValidator(intern_optional)]
 
 
 class GithubUser(BaseModel):
-    login: str
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    login: InternedStr
     id: int
     avatar_url: str
     html_url: str
 
 
 class GitHubItem(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: int
     number: int
     title: str
@@ -19,19 +37,21 @@ class GitHubItem(BaseModel):
     summary: Optional[str] = None
     user: GithubUser
     html_url: str
-    state: str
+    state: InternedStr
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     comments: int
     reactions: int
-    labels: list[str]
+    labels: Labels = ()
     is_pull_request: bool
     merged: Optional[bool] = False
     assignees: Optional[list[GithubUser]] = None
-    author_association: Optional[str] = None
+    author_association: Optional[InternedStr] = None
 
 
 class ContributorActivity(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     username: str
     avatar_url: Optional[str]
     profile_url: Optional[str]
@@ -41,5 +61,12 @@ class ContributorActivity(BaseModel):
 
 
 class PatchItem(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     file: str
     patch: str
+
+
+# Bulk validate/dump for cached sections (list of dicts <-> list of items)
+github_item_list = TypeAdapter(list[GitHubItem])
+contributor_activity_list = TypeAdapter(list[ContributorActivity])
@@ -1,6 +1,16 @@
 """Base repository class."""
-from typing import Generic, TypeVar, Type, Optional, List
-from sqlalchemy import select
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    TypeVar,
+    Type,
+    Optional,
+    List,
+    cast,
+)
+from sqlalchemy import CursorResult, RowMapping, delete, event, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.connection import Base
@@ -16,6 +26,21 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.session = session
 
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run ``callback`` once the session's current transaction commits.
+
+        Process-local caches must be invalidated here rather than right after
+        a write: until the commit, other sessions still read the old rows and
+        would put them straight back into the cache.
+        """
+        event.listen(
+            self.session.sync_session,
+            "after_commit",
+            lambda session: callback(),
+            once=True,
+        )
+
     async def get_by_id(self, id: int) -> Optional[ModelType]:
         """Get a record by ID."""
         result = await self.session.execute(
@@ -30,6 +55,25 @@ class BaseRepository(Generic[ModelType]):
         )
         return list(result.scalars().all())
 
+    async def stream_all(
+        self, limit: int = 100, offset: int = 0
+    ) -> AsyncIterator[ModelType]:
+        """Stream records with pagination instead of materializing the page."""
+        result = await self.session.stream_scalars(
+            select(self.model).limit(limit).offset(offset)
+        )
+        async for instance in result:
+            yield instance
+
+    async def get_all_mappings(
+        self, limit: int = 100, offset: int = 0
+    ) -> List[RowMapping]:
+        """Get records as plain row mappings, skipping ORM instance construction."""
+        result = await self.session.execute(
+            select(self.model.__table__).limit(limit).offset(offset)
+        )
+        return list(result.mappings().all())
+
     async def create(self, **kwargs) -> ModelType:  # type: ignore
         """Create a new record."""
         instance = self.model(**kwargs)
@@ -39,20 +83,34 @@ class BaseRepository(Generic[ModelType]):
         return instance
 
     async def update(self, id: int, **kwargs) -> Optional[ModelType]:  # type: ignore
-        """Update a record by ID."""
-        instance = await self.get_by_id(id)
-        if instance:
-            for key, value in kwargs.items():
-                setattr(instance, key, value)
-            await self.session.flush()
-            await self.session.refresh(instance)
-        return instance
+        """
+        Update a record by ID with a single UPDATE ... RETURNING.
+
+        The returned instance is refreshed in the identity map, so callers that
+        already hold it see the new values.
+        """
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**kwargs)
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return result.scalar_one_or_none()
 
     async def delete(self, id: int) -> bool:
-        """Delete a record by ID."""
-        instance = await self.get_by_id(id)
-        if instance:
-            await self.session.delete(instance)
-            await self.session.flush()
-            return True
-        return False
+        """
+        Delete a record by ID with a single DELETE statement.
+
+        Dependent rows are removed by the database's ON DELETE CASCADE foreign
+        keys rather than ORM relationship cascades.
+        """
+        result = cast(
+            CursorResult[Any],
+            await self.session.execute(
+                delete(self.model)
+                .where(self.model.id == id)
+                .execution_options(synchronize_session=False)
+            ),
+        )
+        return bool(result.rowcount)
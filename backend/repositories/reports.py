@@ -1,21 +1,109 @@
 """Reports repository with section-level caching support."""
-from typing import Literal, Optional, Union
+import asyncio
+import logging
+from typing import Any, Literal, Optional, Sequence, Union
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import select, and_
+from weakref import WeakValueDictionary
+import asyncpg
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, defer
 
+from config import SECTION_CACHE_TTL_SECONDS
+from database.connection import get_pg_pool
 from database.models import Report
 from repositories.base import BaseRepository
+from utils.cache import TTLCache
+from utils.http_cache import section_etag
+
+logger = logging.getLogger(__name__)
 
 SectionType = Literal["prs", "issues", "people", "tldr"]
 
+# Cached sections older than this are regenerated
+SECTION_MAX_AGE = timedelta(hours=1)
+
+# Section -> (data column, generated-at column)
+_SECTION_COLUMNS: dict[
+    str, tuple[InstrumentedAttribute[Any], InstrumentedAttribute[Any]]
+] = {
+    "prs": (Report.prs, Report.prs_generated_at),
+    "issues": (Report.issues, Report.issues_generated_at),
+    "people": (Report.people, Report.people_generated_at),
+    "tldr": (Report.tldr_text, Report.tldr_generated_at),
+}
+
+# Section -> raw SQL for the asyncpg fast path (same queries as the ORM fallback)
+_SECTION_SQL: dict[str, str] = {
+    section: (
+        f"SELECT {data_column.expression.name}, {timestamp_column.expression.name} "
+        "FROM reports WHERE repository_id = $1 AND timeframe = $2 "
+        "ORDER BY created_at DESC LIMIT 1"
+    )
+    for section, (data_column, timestamp_column) in _SECTION_COLUMNS.items()
+}
+# Same, but only if the latest report's section is still fresh ($3 = max age)
+_FRESH_SECTION_SQL: dict[str, str] = {
+    section: (
+        f"SELECT * FROM ({sql}) AS latest "
+        f"WHERE {timestamp_column.expression.name} IS NULL "
+        f"OR {timestamp_column.expression.name} >= now() - $3::interval"
+    )
+    for (section, sql), (_, timestamp_column) in zip(
+        _SECTION_SQL.items(), _SECTION_COLUMNS.values()
+    )
+}
+
+SectionKey = tuple[int, str, str]
+SectionData = Union[dict[str, Any], list[Any], str]
+# (section data, generated_at, ETag); the ETag is hashed once per load
+SectionEntry = tuple[SectionData, Optional[datetime], str]
+
+# Process-local L1 in front of the reports table: (repo_id, timeframe, section)
+# -> (section data, generated_at, ETag). Freshness is still checked on every read.
+_section_cache: TTLCache[SectionKey, SectionEntry] = TTLCache(
+    maxsize=4096, ttl=SECTION_CACHE_TTL_SECONDS
+)
+# Keys whose latest section was missing or stale on the last fresh read, so
+# clients polling for a section that is still being generated skip the DB
+_missing_sections: TTLCache[SectionKey, bool] = TTLCache(
+    maxsize=10_000, ttl=SECTION_CACHE_TTL_SECONDS
+)
+# Bumped on every section invalidation; a read that started before one does
+# not cache what it loaded (or that it found nothing), since it may predate
+# the committed write
+_section_epoch = 0
+# One lock per key so concurrent misses for the same section hit the DB once
+_section_locks: "WeakValueDictionary[SectionKey, asyncio.Lock]" = WeakValueDictionary()
+
+
+def _section_lock(key: SectionKey) -> asyncio.Lock:
+    lock = _section_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _section_locks[key] = lock
+    return lock
+
+
+def _invalidate_section_cache(key: SectionKey) -> None:
+    global _section_epoch
+    _section_epoch += 1
+    _section_cache.pop(key)
+    _missing_sections.pop(key)
+
 
 class ReportsRepository(BaseRepository[Report]):
     """Repository for Report model with section-level caching operations."""
 
-    def __init__(self, session: AsyncSession):
-        """Initialize reports repository."""
+    def __init__(self, session: AsyncSession, pg_pool: Optional[asyncpg.Pool] = None):
+        """Initialize reports repository.
+
+        Section reads go through ``pg_pool`` (defaulting to the app-wide asyncpg
+        pool) when one is available, and through the ORM session otherwise.
+        """
         super().__init__(Report, session)
+        self._pg = pg_pool if pg_pool is not None else get_pg_pool()
 
     async def get_or_create_report_record(
         self,
@@ -55,18 +143,35 @@ class ReportsRepository(BaseRepository[Report]):
         result = await self.session.execute(query)
         report = result.scalar_one_or_none()
 
-        if not report:
-            # Create new report record
-            report = Report(
+        if report:
+            return report
+
+        # Create new report record; INSERT ... RETURNING hydrates it in the same
+        # round-trip. A concurrent request may have created the same window
+        # first, in which case nothing is returned and we read theirs.
+        result = await self.session.execute(
+            insert(Report)
+            .values(
                 repository_id=repository_id,
                 timeframe=timeframe,
                 timeframe_start=timeframe_start,
                 timeframe_end=timeframe_end,
                 version=2,  # Version 2 = section-level caching
             )
-            self.session.add(report)
-            await self.session.flush()
-            await self.session.refresh(report)
+            .on_conflict_do_nothing(
+                index_elements=[
+                    Report.repository_id,
+                    Report.timeframe,
+                    Report.timeframe_start,
+                    Report.timeframe_end,
+                ]
+            )
+            .returning(Report)
+        )
+        report = result.scalar_one_or_none()
+        if report is None:
+            result = await self.session.execute(query)
+            report = result.scalar_one()
 
         return report
 
@@ -76,7 +181,7 @@ class ReportsRepository(BaseRepository[Report]):
         timeframe: str,
         section: SectionType,
         skip_expiration_check: bool = False,
-    ) -> Optional[Union[dict, list, str]]:
+    ) -> Optional[SectionData]:
         """
         Get cached section data if it exists and is fresh (< 1 hour old).
 
@@ -89,9 +194,136 @@ class ReportsRepository(BaseRepository[Report]):
         Returns:
             Section data if cached and fresh, None otherwise
         """
-        # Get the most recent report for this repo + timeframe
+        entry = await self.get_cached_section_entry(
+            repository_id, timeframe, section, skip_expiration_check
+        )
+        return entry[0] if entry is not None else None
+
+    async def get_cached_sections(
+        self,
+        repository_id: int,
+        timeframe: str,
+        sections: Sequence[SectionType],
+        skip_expiration_check: bool = False,
+    ) -> dict[SectionType, Optional[SectionData]]:
+        """
+        Get several cached sections at once, keyed by section name.
+
+        With the asyncpg pool each read checks out its own connection, so the
+        sections load concurrently; the ORM fallback shares one session and
+        reads them one after another.
+        """
+        if self._pg is not None:
+            results = await asyncio.gather(
+                *(
+                    self.get_cached_section(
+                        repository_id, timeframe, section, skip_expiration_check
+                    )
+                    for section in sections
+                )
+            )
+            return dict(zip(sections, results))
+
+        return {
+            section: await self.get_cached_section(
+                repository_id, timeframe, section, skip_expiration_check
+            )
+            for section in sections
+        }
+
+    async def get_cached_section_entry(
+        self,
+        repository_id: int,
+        timeframe: str,
+        section: SectionType,
+        skip_expiration_check: bool = False,
+    ) -> Optional[SectionEntry]:
+        """
+        Like get_cached_section(), but return (section data, generated_at, ETag).
+
+        The ETag lets callers answer conditional requests without hashing the
+        section again.
+        """
+        cache_key = (repository_id, timeframe, section)
+        entry = _section_cache.get(cache_key)
+        if entry is None:
+            if not skip_expiration_check and _missing_sections.get(cache_key):
+                return None
+            async with _section_lock(cache_key):
+                # Another coroutine may have filled the entry while we waited
+                entry = _section_cache.get(cache_key)
+                if entry is None:
+                    if not skip_expiration_check and _missing_sections.get(cache_key):
+                        return None
+                    epoch = _section_epoch
+                    entry = await self._load_section(
+                        repository_id,
+                        timeframe,
+                        section,
+                        fresh_only=not skip_expiration_check,
+                    )
+                    cacheable = epoch == _section_epoch
+                    if entry is None:
+                        if cacheable and not skip_expiration_check:
+                            _missing_sections.set(cache_key, True)
+                        return None
+                    if cacheable:
+                        _section_cache.set(cache_key, entry)
+
+        section_timestamp = entry[1]
+
+        # Entries loaded with the SQL freshness filter are fresh, but L1 hits
+        # may have aged (or been loaded with skip_expiration_check)
+        if not skip_expiration_check:
+            if section_timestamp:
+                age = datetime.now(timezone.utc) - section_timestamp
+                if age > SECTION_MAX_AGE:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Cache expired for %s (age: %.1f minutes)",
+                            section,
+                            age.total_seconds() / 60,
+                        )
+                    return None
+
+        return entry
+
+    async def _load_section(
+        self,
+        repository_id: int,
+        timeframe: str,
+        section: SectionType,
+        fresh_only: bool,
+    ) -> Optional[SectionEntry]:
+        """
+        Read one section and its timestamp from the latest matching report.
+
+        With ``fresh_only`` the age check runs in SQL, so a stale section's
+        JSON never leaves the database.
+        """
+        if self._pg is not None:
+            # Hot path: one prepared statement, no ORM compile/row processing
+            if fresh_only:
+                pg_row = await self._pg.fetchrow(
+                    _FRESH_SECTION_SQL[section],
+                    repository_id,
+                    timeframe,
+                    SECTION_MAX_AGE,
+                )
+            else:
+                pg_row = await self._pg.fetchrow(
+                    _SECTION_SQL[section], repository_id, timeframe
+                )
+            if pg_row is None or pg_row[0] is None:
+                return None
+            return pg_row[0], pg_row[1], section_etag(pg_row[0])
+
+        data_column, timestamp_column = _SECTION_COLUMNS[section]
+
+        # Load only this section and its timestamp from the most recent report
+        # for this repo + timeframe, not the whole row of JSON blobs
         query = (
-            select(Report)
+            select(data_column, timestamp_column)
             .where(
                 and_(
                     Report.repository_id == repository_id,
@@ -101,39 +333,29 @@ class ReportsRepository(BaseRepository[Report]):
             .order_by(Report.created_at.desc())
             .limit(1)
         )
+        if fresh_only:
+            latest = query.subquery("latest")
+            generated_at = latest.c[timestamp_column.key]
+            query = select(latest).where(
+                or_(
+                    generated_at.is_(None),
+                    generated_at >= func.now() - SECTION_MAX_AGE,
+                )
+            )
 
         result = await self.session.execute(query)
-        report = result.scalar_one_or_none()
-
-        if not report:
-            return None
-
-        # Map section name to actual column name (tldr -> tldr_text)
-        column_name = "tldr_text" if section == "tldr" else section
+        row = result.first()
 
-        # Get section data
-        section_data = getattr(report, column_name, None)
-        if section_data is None:
+        if row is None or row[0] is None:
             return None
 
-        # Check expiration (1 hour threshold) unless explicitly skipped
-        if not skip_expiration_check:
-            section_timestamp = getattr(report, f"{column_name}_generated_at", None)
-            if section_timestamp:
-                age = datetime.now(timezone.utc) - section_timestamp
-                if age > timedelta(hours=1):
-                    print(
-                        f"⏰ Cache expired for {section} (age: {age.total_seconds() / 60:.1f} minutes)"
-                    )
-                    return None
-
-        return section_data
+        return row[0], row[1], section_etag(row[0])
 
     async def update_section(
         self,
         report_id: int,
         section: SectionType,
-        data: Union[dict, list, str],
+        data: SectionData,
     ) -> Report:
         """
         Update a specific section of a report with new data.
@@ -146,32 +368,47 @@ class ReportsRepository(BaseRepository[Report]):
         Returns:
             Updated Report
         """
-        # Get the report
-        query = select(Report).where(Report.id == report_id)
-        result = await self.session.execute(query)
+        data_column, timestamp_column = _SECTION_COLUMNS[section]
+
+        # Single UPDATE ... RETURNING: no prior SELECT, no flush + refresh, and
+        # the timestamp comes from the database clock
+        result = await self.session.execute(
+            update(Report)
+            .where(Report.id == report_id)
+            .values({data_column.key: data, timestamp_column.key: func.now()})
+            .returning(Report)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
         report = result.scalar_one_or_none()
 
         if not report:
             raise ValueError(f"Report with ID {report_id} not found")
 
-        # Map section name to actual column name (tldr -> tldr_text)
-        column_name = "tldr_text" if section == "tldr" else section
-
-        # Update section data and timestamp
-        now = datetime.now(timezone.utc)
-        setattr(report, column_name, data)
-        setattr(report, f"{column_name}_generated_at", now)
-
-        await self.session.flush()
-        await self.session.refresh(report)
+        cache_key = (report.repository_id, report.timeframe, section)
+        # Drop the cached copy only once the new data is visible to other
+        # sessions; popping before the commit lets a concurrent read refill
+        # the cache with the old row
+        self.on_commit(lambda: _invalidate_section_cache(cache_key))
         return report
 
     async def get_reports_by_repository(
         self, repository_id: int, limit: int = 10
     ) -> list[Report]:
-        """Get all reports for a repository."""
+        """
+        Get all reports for a repository (metadata only).
+
+        The section payloads are deferred since they can be megabytes of JSON
+        per row; read them through get_cached_section() instead (lazy loads
+        are not available on an AsyncSession).
+        """
         result = await self.session.execute(
             select(Report)
+            .options(
+                defer(Report.prs),
+                defer(Report.issues),
+                defer(Report.people),
+                defer(Report.tldr_text),
+            )
             .where(Report.repository_id == repository_id)
             .order_by(
                 Report.created_at.desc()
@@ -1,11 +1,16 @@
 """Repository repository with CRUD operations."""
-from typing import Optional
-from sqlalchemy import select
+from datetime import timedelta
+from typing import Any, Optional
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import Repository
 from repositories.base import BaseRepository
 
+# How long cached repository metadata can stand in for a GitHub lookup
+REPOSITORY_METADATA_TTL = timedelta(hours=1)
+
 
 class RepositoriesRepository(BaseRepository[Repository]):
     """Repository for Repository model operations."""
@@ -15,13 +20,17 @@ class RepositoriesRepository(BaseRepository[Repository]):
         super().__init__(Repository, session)
 
     async def get_by_full_name(self, full_name: str) -> Optional[Repository]:
-        """Get repository by full name (owner/repo)."""
+        """Get repository by full name (owner/repo), ignoring case."""
         result = await self.session.execute(
-            select(Repository).where(Repository.full_name == full_name)
+            select(Repository).where(
+                func.lower(Repository.full_name) == full_name.lower()
+            )
         )
         return result.scalar_one_or_none()
 
-    async def get_or_create_repository(self, repo_data: dict[str, object]) -> Repository:
+    async def get_or_create_repository(
+        self, repo_data: dict[str, object]
+    ) -> Repository:
         """
         Get or create repository from GitHub data.
 
@@ -42,46 +51,65 @@ class RepositoriesRepository(BaseRepository[Repository]):
         Returns:
             Repository: The existing or newly created repository
         """
-        # Try to get existing repository by full_name
-        existing_repo = await self.get_by_full_name(repo_data["full_name"])
-
-        if existing_repo:
-            # Update repository metadata
-            existing_repo.owner = repo_data["owner"]
-            existing_repo.name = repo_data["name"]
-            existing_repo.description = repo_data.get("description")
-            existing_repo.html_url = repo_data["html_url"]
-            existing_repo.is_private = repo_data.get("is_private", False)
-            existing_repo.is_fork = repo_data.get("is_fork", False)
-            existing_repo.is_archived = repo_data.get("is_archived", False)
-            existing_repo.language = repo_data.get("language")
-            existing_repo.stargazers_count = repo_data.get("stargazers_count", 0)
-
-            if "updated_at" in repo_data:
-                existing_repo.github_updated_at = repo_data["updated_at"]
+        full_name = str(repo_data["full_name"])
+        values: dict[str, Any] = {
+            "full_name": full_name,
+            "owner": repo_data["owner"],
+            "name": repo_data["name"],
+            "description": repo_data.get("description"),
+            "html_url": repo_data["html_url"],
+            "is_private": repo_data.get("is_private", False),
+            "is_fork": repo_data.get("is_fork", False),
+            "is_archived": repo_data.get("is_archived", False),
+            "language": repo_data.get("language"),
+            "stargazers_count": repo_data.get("stargazers_count", 0),
+            "github_updated_at": repo_data.get("updated_at"),
+        }
 
-            await self.session.flush()
-            await self.session.refresh(existing_repo)
-            return existing_repo
+        # Refresh metadata on the existing row but keep its stored full_name
+        # casing; github_updated_at is only overwritten when provided
+        changed = [key for key in values if key != "full_name"]
+        if "updated_at" not in repo_data:
+            changed.remove("github_updated_at")
 
-        # Create new repository
-        new_repo = Repository(
-            full_name=repo_data["full_name"],
-            owner=repo_data["owner"],
-            name=repo_data["name"],
-            description=repo_data.get("description"),
-            html_url=repo_data["html_url"],
-            is_private=repo_data.get("is_private", False),
-            is_fork=repo_data.get("is_fork", False),
-            is_archived=repo_data.get("is_archived", False),
-            language=repo_data.get("language"),
-            stargazers_count=repo_data.get("stargazers_count", 0),
-            github_updated_at=repo_data.get("updated_at"),
+        # Single INSERT ... ON CONFLICT DO UPDATE ... RETURNING, no race between
+        # lookup and insert. The UPDATE only fires when some metadata field
+        # differs or last_synced_at has gone stale, so re-reading an unchanged
+        # repository usually writes nothing; updated_at only moves on changes.
+        insert_stmt = insert(Repository).values(values)
+        metadata_changed = or_(
+            *(
+                Repository.__table__.c[key].is_distinct_from(insert_stmt.excluded[key])
+                for key in changed
+            )
+        )
+        upsert_stmt = (
+            insert_stmt.on_conflict_do_update(
+                index_elements=[func.lower(Repository.full_name)],
+                set_={
+                    **{key: insert_stmt.excluded[key] for key in changed},
+                    "updated_at": case(
+                        (metadata_changed, func.now()), else_=Repository.updated_at
+                    ),
+                    "last_synced_at": func.now(),
+                },
+                where=or_(
+                    metadata_changed,
+                    Repository.last_synced_at.is_(None),
+                    Repository.last_synced_at < func.now() - REPOSITORY_METADATA_TTL,
+                ),
+            )
+            .returning(Repository)
+            .execution_options(populate_existing=True)
         )
-        self.session.add(new_repo)
-        await self.session.flush()
-        await self.session.refresh(new_repo)
-        return new_repo
+        result = await self.session.execute(upsert_stmt)
+        repo = result.scalar_one_or_none()
+        if repo is None:
+            # Conflict with nothing to update: the row is already current
+            repo = await self.get_by_full_name(full_name)
+            if repo is None:
+                raise ValueError(f"Repository {full_name} not found")
+        return repo
 
     async def update_repository_metadata(
         self, repo_id: int, metadata: dict[str, object]
@@ -1,11 +1,17 @@
 """User-Repository tracking repository."""
 from typing import List, Optional
-from sqlalchemy import select, and_
+from sqlalchemy import and_, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from database.models import UserRepository, Repository
 from repositories.base import BaseRepository
+from utils.cache import TTLCache
+
+# Serialized GET /users/me/repositories payloads keyed by user ID. Entries are
+# dropped whenever that user's tracked set changes; the TTL is a safety net for
+# repository metadata (stars, description) refreshed by other requests.
+tracked_repositories_cache: TTLCache[int, bytes] = TTLCache(maxsize=1024, ttl=300)
 
 
 class UserRepositoriesRepository(BaseRepository[UserRepository]):
@@ -15,30 +21,31 @@ class UserRepositoriesRepository(BaseRepository[UserRepository]):
         """Initialize user repositories repository."""
         super().__init__(UserRepository, session)
 
-    async def track_repository(
-        self, user_id: int, repository_id: int
-    ) -> UserRepository:
+    async def track_repository(self, user_id: int, repository_id: int) -> bool:
         """
-        Track a repository for a user.
+        Track a repository for a user (no-op if already tracked).
 
         Args:
             user_id: User ID
             repository_id: Repository ID
 
         Returns:
-            UserRepository: The tracking record
+            bool: True if a new tracking record was created
         """
-        # Check if already tracking
-        existing = await self.get_tracking(user_id, repository_id)
-        if existing:
-            return existing
-
-        # Create new tracking record
-        tracking = UserRepository(user_id=user_id, repository_id=repository_id)
-        self.session.add(tracking)
-        await self.session.flush()
-        await self.session.refresh(tracking)
-        return tracking
+        # Single INSERT ... ON CONFLICT DO NOTHING: no lookup beforehand, and
+        # concurrent requests for the same pair cannot race into a duplicate
+        result = await self.session.execute(
+            insert(UserRepository)
+            .values(user_id=user_id, repository_id=repository_id)
+            .on_conflict_do_nothing(
+                index_elements=[UserRepository.user_id, UserRepository.repository_id]
+            )
+            .returning(UserRepository.id)
+        )
+        created = result.scalar_one_or_none() is not None
+        if created:
+            self._invalidate_tracked_after_commit(user_id)
+        return created
 
     async def untrack_repository(self, user_id: int, repository_id: int) -> bool:
         """
@@ -51,12 +58,25 @@ class UserRepositoriesRepository(BaseRepository[UserRepository]):
         Returns:
             bool: True if untracked, False if not found
         """
-        tracking = await self.get_tracking(user_id, repository_id)
-        if tracking:
-            await self.session.delete(tracking)
-            await self.session.flush()
-            return True
-        return False
+        result = await self.session.execute(
+            delete(UserRepository)
+            .where(
+                and_(
+                    UserRepository.user_id == user_id,
+                    UserRepository.repository_id == repository_id,
+                )
+            )
+            .returning(UserRepository.id)
+        )
+        if result.scalar_one_or_none() is None:
+            return False
+        self._invalidate_tracked_after_commit(user_id)
+        return True
+
+    def _invalidate_tracked_after_commit(self, user_id: int) -> None:
+        # Until the commit other sessions still see the old tracked set, so an
+        # earlier pop would let a concurrent GET cache it again
+        self.on_commit(lambda: tracked_repositories_cache.pop(user_id))
 
     async def get_tracking(
         self, user_id: int, repository_id: int
@@ -74,7 +94,7 @@ class UserRepositoriesRepository(BaseRepository[UserRepository]):
 
     async def get_user_repositories(self, user_id: int) -> List[Repository]:
         """
-        Get all repositories tracked by a user.
+        Get all repositories tracked by a user, most recently tracked first.
 
         Args:
             user_id: User ID
@@ -83,15 +103,61 @@ class UserRepositoriesRepository(BaseRepository[UserRepository]):
             List[Repository]: List of tracked repositories
         """
         result = await self.session.execute(
-            select(UserRepository)
-            .options(joinedload(UserRepository.repository))
+            select(Repository)
+            .join(UserRepository, UserRepository.repository_id == Repository.id)
+            .where(UserRepository.user_id == user_id)
+            .order_by(UserRepository.id.desc())
+        )
+        return list(result.scalars().all())
+
+    async def get_user_repositories_page(
+        self, user_id: int, limit: int, cursor: Optional[int] = None
+    ) -> tuple[List[Repository], Optional[int]]:
+        """
+        Get one page of repositories tracked by a user (keyset pagination).
+
+        Args:
+            user_id: User ID
+            limit: Maximum number of repositories to return
+            cursor: `next_cursor` from the previous page, None for the first page
+
+        Returns:
+            (repositories, next_cursor): next_cursor is None on the last page
+        """
+        query = (
+            select(UserRepository.id, Repository)
+            .join(UserRepository, UserRepository.repository_id == Repository.id)
+            .where(UserRepository.user_id == user_id)
+            .order_by(UserRepository.id.desc())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            query = query.where(UserRepository.id < cursor)
+
+        rows = (await self.session.execute(query)).all()
+        page = rows[:limit]
+        next_cursor = page[-1][0] if len(rows) > limit else None
+        return [repo for _, repo in page], next_cursor
+
+    async def count_user_repositories(self, user_id: int) -> int:
+        """Count repositories tracked by a user."""
+        result = await self.session.execute(
+            select(func.count())
+            .select_from(UserRepository)
             .where(UserRepository.user_id == user_id)
-            .order_by(UserRepository.added_at.desc())
         )
-        trackings = result.scalars().all()
-        return [tracking.repository for tracking in trackings]
+        return result.scalar_one()
 
     async def is_tracking(self, user_id: int, repository_id: int) -> bool:
         """Check if user is tracking a repository."""
-        tracking = await self.get_tracking(user_id, repository_id)
-        return tracking is not None
+        result = await self.session.execute(
+            select(
+                exists().where(
+                    and_(
+                        UserRepository.user_id == user_id,
+                        UserRepository.repository_id == repository_id,
+                    )
+                )
+            )
+        )
+        return result.scalar_one()
@@ -1,6 +1,7 @@
 """User repository with CRUD operations."""
 from typing import Any, Optional
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import User
@@ -34,28 +35,30 @@ class UsersRepository(BaseRepository[User]):
         Returns:
             User: The existing or newly created user
         """
-        # Try to get existing user by GitHub ID
-        existing_user = await self.get_by_id(github_user["id"])
-
-        if existing_user:
-            # Update user data in case anything changed
-            existing_user.login = github_user["login"]
-            existing_user.name = github_user.get("name")
-            existing_user.email = github_user.get("email")
-            existing_user.avatar_url = github_user.get("avatar_url")
-            await self.session.flush()
-            await self.session.refresh(existing_user)
-            return existing_user
-
-        # Create new user
-        new_user = User(
-            id=github_user["id"],
-            login=github_user["login"],
-            name=github_user.get("name"),
-            email=github_user.get("email"),
-            avatar_url=github_user.get("avatar_url"),
+        values = {
+            "id": github_user["id"],
+            "login": github_user["login"],
+            "name": github_user.get("name"),
+            "email": github_user.get("email"),
+            "avatar_url": github_user.get("avatar_url"),
+        }
+
+        # Single upsert keyed by GitHub ID, returning the row in the same trip
+        stmt = (
+            insert(User)
+            .values(values)
+            .on_conflict_do_update(
+                index_elements=[User.id],
+                set_={
+                    "login": values["login"],
+                    "name": values["name"],
+                    "email": values["email"],
+                    "avatar_url": values["avatar_url"],
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(User)
+            .execution_options(populate_existing=True)
         )
-        self.session.add(new_user)
-        await self.session.flush()
-        await self.session.refresh(new_user)
-        return new_user
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
@@ -1,14 +1,20 @@
-import json
-from typing import AsyncGenerator, Optional
+from time import monotonic
+from typing import AsyncGenerator, Iterable, Optional, Union
 
+import orjson
 from github.IssueComment import IssueComment
 from github.PaginatedList import PaginatedList
 from github.PullRequestReview import PullRequestReview
-from openai import AsyncOpenAI
 
-from config import OPENAI_API_KEY, OPENAI_MODEL
+from config import OPENAI_MODEL
+from services.openai_client import openai
 
-openai = AsyncOpenAI(api_key=OPENAI_API_KEY)
+# The model only needs the gist of long descriptions; the tail is cut anyway
+MAX_BODY_CHARS = 8000
+
+# Flush buffered stream output at this size or after this long, whichever first
+STREAM_FLUSH_CHARS = 256
+STREAM_FLUSH_SECONDS = 0.05
 
 PROMPT_ISSUE_DEEPDIVE = """
 You are an expert GitHub analyst.
@@ -39,6 +45,21 @@ Do not include any additional commentary or explanations outside the structured
 """
 
 
+def _authored_bodies(
+    entries: Optional[Iterable[Union[PullRequestReview, IssueComment]]],
+) -> list[dict[str, object]]:
+    """Reduce reviews/comments to their body and author login."""
+    if not entries:
+        return []
+    return [
+        {
+            "body": getattr(entry, "body", entry),
+            "author": getattr(getattr(entry, "user", None), "login", "Unknown"),
+        }
+        for entry in entries
+    ]
+
+
 async def generate_deep_dive(
     title: str,
     body: str,
@@ -49,38 +70,45 @@ async def generate_deep_dive(
 
     context = {
         "title": title,
-        "body": body or "",
-        "reviews": [
-            {
-                "body": getattr(review, "body", review),
-                "author": getattr(getattr(review, "user", None), "login", "Unknown"),
-            }
-            for review in (reviews or [])
-        ],
-        "comments": [
-            {
-                "body": getattr(comment, "body", comment),
-                "author": getattr(getattr(comment, "user", None), "login", "Unknown"),
-            }
-            for comment in (comments or [])
-        ],
+        "body": (body or "")[:MAX_BODY_CHARS],
+        "reviews": _authored_bodies(reviews),
+        "comments": _authored_bodies(comments),
     }
 
+    buffer: list[str] = []
     try:
         stream = await openai.chat.completions.create(
             model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": PROMPT_ISSUE_DEEPDIVE.strip()},
-                {"role": "user", "content": json.dumps(context)},
+                {"role": "user", "content": orjson.dumps(context).decode()},
             ],
             stream=True,
         )
 
+        # Tokens arrive a few characters at a time; coalesce them so the
+        # response is written in fewer, larger chunks
+        buffered = 0
+        last_flush = monotonic()
         async for chunk in stream:
             delta = chunk.choices[0].delta
             content = getattr(delta, "content", None)
             if content:
-                yield content
+                buffer.append(content)
+                buffered += len(content)
+                if (
+                    buffered >= STREAM_FLUSH_CHARS
+                    or monotonic() - last_flush >= STREAM_FLUSH_SECONDS
+                ):
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered = 0
+                    last_flush = monotonic()
+
+        if buffer:
+            yield "".join(buffer)
 
     except Exception as e:
+        if buffer:
+            yield "".join(buffer)
         yield f"\n⚠️ Error generating summary: {str(e)}"
@@ -1,8 +1,16 @@
-from openai import AsyncOpenAI
+import asyncio
+from hashlib import blake2b
+from typing import Sequence
 
-from config import OPENAI_API_KEY, OPENAI_MODEL
+import orjson
 
-openai = AsyncOpenAI(api_key=OPENAI_API_KEY)
+from config import OPENAI_MODEL
+from services.openai_client import openai
+from utils.cache import TTLCache
+
+# Explanations keyed by a hash of (file, diff); the same patch is explained
+# again whenever a PR's diff view is reopened
+_explanations: TTLCache[bytes, str] = TTLCache(maxsize=2048, ttl=7 * 24 * 60 * 60)
 
 DIFF_EXPLAINER_PROMPT = """
 You are an expert GitHub diff explainer. Your task is to analyze the diff of a file from a pull request and generate a clear, concise summary of the most meaningful changes.
@@ -18,19 +26,135 @@ Keep the explanation under 50 words.
 Respond with plain text only.
 """
 
+BATCH_DIFF_EXPLAINER_PROMPT = """
+You are an expert GitHub diff explainer. Your task is to analyze the diffs of several files from a pull request and generate, for each file, a clear, concise summary of the most meaningful changes.
+
+Ignore trivial changes (e.g. formatting, comments).
+
+Focus on:
+- Key areas of focus and components affected.
+- Rationale behind the changes and their impact.
+- Any potential implications or follow-ups.
+
+Keep each explanation under 50 words.
+Respond with a JSON object mapping each file path, exactly as given, to its plain-text explanation.
+"""
+
+# Files explained per OpenAI request, and per-diff / per-request size caps
+DIFFS_PER_REQUEST = 10
+MAX_DIFF_CHARS = 6000
+MAX_REQUEST_CHARS = 24000
+
+# OpenAI requests in flight at once across the process
+MAX_CONCURRENT_REQUESTS = 8
+
+_request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _cache_key(file: str, diff: str) -> bytes:
+    return blake2b(f"{file}\0{diff}".encode(), digest_size=16).digest()
+
+
+def _batches(items: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+    """Group (file, diff) pairs by count and total size."""
+    batches: list[list[tuple[str, str]]] = []
+    current: list[tuple[str, str]] = []
+    size = 0
+    for file, diff in items:
+        if current and (
+            len(current) >= DIFFS_PER_REQUEST or size + len(diff) > MAX_REQUEST_CHARS
+        ):
+            batches.append(current)
+            current, size = [], 0
+        current.append((file, diff))
+        size += len(diff)
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def _explain_one(file: str, diff: str) -> dict[str, str]:
+    try:
+        async with _request_slots:
+            response = await openai.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": DIFF_EXPLAINER_PROMPT.strip()},
+                    {"role": "user", "content": f"File: {file}\n\nDiff:\n{diff}"},
+                ],
+            )
+        return {file: response.choices[0].message.content or ""}
+    except Exception:
+        return {}
+
+
+async def _explain_batch(batch: list[tuple[str, str]]) -> dict[str, str]:
+    if len(batch) == 1:
+        return await _explain_one(*batch[0])
+
+    content = "\n\n".join(f"File: {file}\n\nDiff:\n{diff}" for file, diff in batch)
+    try:
+        async with _request_slots:
+            response = await openai.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": BATCH_DIFF_EXPLAINER_PROMPT.strip()},
+                    {"role": "user", "content": content},
+                ],
+                response_format={"type": "json_object"},
+            )
+        parsed = orjson.loads(response.choices[0].message.content or "{}")
+        if not isinstance(parsed, dict):
+            raise ValueError("Expected a JSON object of explanations")
+    except Exception:
+        parsed = {}
+
+    explanations = {
+        file: explanation
+        for file, _ in batch
+        if isinstance(explanation := parsed.get(file), str)
+    }
+    # Files the reply left out or renamed (or the whole batch, if the reply was
+    # unusable) are retried one by one, so a bad reply never blanks the batch
+    missing = [(file, diff) for file, diff in batch if file not in explanations]
+    for result in await asyncio.gather(*(_explain_one(*item) for item in missing)):
+        explanations.update(result)
+    return explanations
+
+
+async def explain_diffs(items: Sequence[tuple[str, str]]) -> dict[str, str]:
+    """
+    Explain several file diffs, keyed by file path.
+
+    Cached explanations are reused; the rest are grouped into a few prompts
+    (DIFFS_PER_REQUEST files each) that run concurrently, at most
+    MAX_CONCURRENT_REQUESTS at a time across the process. Files whose
+    explanation could not be generated map to "".
+    """
+    explanations: dict[str, str] = {}
+    pending: list[tuple[str, str]] = []
+    keys: dict[str, bytes] = {}
+    for file, diff in items:
+        diff = diff.strip()[:MAX_DIFF_CHARS]
+        keys[file] = _cache_key(file, diff)
+        cached = _explanations.get(keys[file])
+        if cached is not None:
+            explanations[file] = cached
+        else:
+            pending.append((file, diff))
+
+    results = await asyncio.gather(*(_explain_batch(b) for b in _batches(pending)))
+    for result in results:
+        for file, explanation in result.items():
+            if explanation:
+                _explanations.set(keys[file], explanation)
+            explanations[file] = explanation
+
+    return {file: explanations.get(file, "") for file, _ in items}
+
 
 async def explain_diff(file: str, diff: str) -> str:
     """
     Summarize the most meaningful and impactful changes made to a given file, based on its diff.
     """
-    try:
-        response = await openai.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": DIFF_EXPLAINER_PROMPT.strip()},
-                {"role": "user", "content": f"File: {file}\n\nDiff:\n{diff.strip()}"},
-            ],
-        )
-        return response.choices[0].message.content or ""
-    except Exception:
-        return ""
+    return (await explain_diffs([(file, diff)]))[file]
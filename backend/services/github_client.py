@@ -1,36 +1,160 @@
 import asyncio
+import heapq
+import time
 from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Literal, Optional, Union
-
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from hashlib import blake2b
+from operator import itemgetter
+from typing import Any, Callable, Literal, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+import httpx
 from github import Github
 from github.File import File as PullRequestFile
 from github.Issue import Issue
+from github.NamedUser import NamedUser
 from github.PaginatedList import PaginatedList
-from github.PullRequest import PullRequest
 from github.PullRequestReview import PullRequestReview
 from github.Repository import Repository
 
 from config import COMMON_GITHUB_BOTS, MAX_ITEMS_PER_SECTION
 from models.github import PatchItem
+from utils.cache import TTLCache
+
+T = TypeVar("T")
+
+# Shared keep-alive client for direct GitHub HTTP calls (OAuth exchange, token
+# validation) so each request reuses pooled TLS connections instead of
+# handshaking anew. Closed from the FastAPI lifespan.
+github_http = httpx.AsyncClient(
+    headers={"Accept": "application/vnd.github+json"},
+    timeout=httpx.Timeout(10.0),
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+)
+
+
+# ETag of the last GET /user response per token fingerprint. Conditional
+# requests that come back 304 do not count against the rate limit.
+_user_etags: TTLCache[bytes, str] = TTLCache(maxsize=10_000, ttl=60 * 60)
+
+
+async def close_github_http() -> None:
+    """Close the shared GitHub HTTP client."""
+    await github_http.aclose()
+
+
+async def is_github_token_valid(github_token: str) -> bool:
+    """Check a GitHub token against GET /user, revalidating with If-None-Match."""
+    token_key = blake2b(github_token.encode(), digest_size=16).digest()
+    headers = {"Authorization": f"Bearer {github_token}"}
+    etag = _user_etags.get(token_key)
+    if etag is not None:
+        headers["If-None-Match"] = etag
+
+    response = await github_http.get("https://api.github.com/user", headers=headers)
+
+    if response.status_code == 304:
+        return True
+    if response.status_code != 200:
+        _user_etags.pop(token_key)
+        return False
+    if etag := response.headers.get("etag"):
+        _user_etags.set(token_key, etag)
+    return True
+
+
+class GitHubThrottle:
+    """
+    Bound concurrent GitHub API calls and hold new ones while GitHub says to.
+
+    Every response's rate-limit headers are fed to observe(); once the quota is
+    exhausted (or a Retry-After arrives) callers wait here instead of each
+    burning a request on a 403 that PyGithub then retries.
+    """
+
+    # Never hold requests longer than this, even if the reset is further away
+    MAX_PAUSE_SECONDS = 60.0
+
+    def __init__(self, max_concurrency: int = 32) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._resume_at = 0.0
+
+    def observe(self, headers: Mapping[str, Any]) -> None:
+        """Update the pause window from a GitHub response's headers."""
+        headers = {key.lower(): value for key, value in headers.items()}
+        now = time.time()
+        resume_at = 0.0
+        if "retry-after" in headers:
+            resume_at = now + float(headers["retry-after"])
+        elif str(headers.get("x-ratelimit-remaining")) == "0":
+            resume_at = float(headers.get("x-ratelimit-reset", 0))
+        if resume_at > self._resume_at:
+            self._resume_at = min(resume_at, now + self.MAX_PAUSE_SECONDS)
+
+    async def __aenter__(self) -> None:
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self._semaphore.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._semaphore.release()
 
 
+github_throttle = GitHubThrottle()
+
+
+async def run_github(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking PyGithub call in a worker thread under github_throttle."""
+    async with github_throttle:
+        return await asyncio.to_thread(func, *args)
+
+
+@lru_cache(maxsize=4096)
 def is_bot(user_login: str) -> bool:
     user_login = user_login.lower()
-    return user_login in COMMON_GITHUB_BOTS
+    # GitHub App accounts always end in [bot], listed or not
+    return user_login.endswith("[bot]") or user_login in COMMON_GITHUB_BOTS
+
+
+# Core quota last read per GitHub client as (monotonic time, remaining); the
+# /rate_limit probe runs at most once per interval instead of before every
+# search
+RATE_LIMIT_CHECK_INTERVAL = 60.0
+_core_remaining: "WeakKeyDictionary[Github, tuple[float, int]]" = WeakKeyDictionary()
 
 
 def is_near_rate_limit(github: Github, threshold: int = 100) -> bool:
-    core_limit = github.get_rate_limit().core
-    return core_limit.remaining < threshold
+    checked = _core_remaining.get(github)
+    now = time.monotonic()
+    if checked is None or now - checked[0] > RATE_LIMIT_CHECK_INTERVAL:
+        checked = (now, github.get_rate_limit().core.remaining)
+        _core_remaining[github] = checked
+    return checked[1] < threshold
+
+
+# Contributor stats are all-time totals and can take GitHub a while to compute
+# (202 responses), so keep them per repository for a day
+TOP_CONTRIBUTORS_TTL_SECONDS = 24 * 60 * 60
+_top_contributors_cache: TTLCache[tuple[str, int], list[str]] = TTLCache(
+    maxsize=256, ttl=TOP_CONTRIBUTORS_TTL_SECONDS
+)
 
 
 def get_top_contributors(repo: Repository, top_n: int = 10) -> list[str]:
     """Return the top N non-bot contributor usernames, sorted by total commits."""
 
+    cache_key = (repo.full_name.lower(), top_n)
+    cached = _top_contributors_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     stats = repo.get_stats_contributors()
 
     if not stats:
+        # Stats may still be computing on GitHub's side; retry on a later call
         return []
 
     sorted_contributors = sorted(stats, key=lambda s: s.total, reverse=True)
@@ -41,6 +165,7 @@ def get_top_contributors(repo: Repository, top_n: int = 10) -> list[str]:
         if getattr(s.author, "login", None) and not is_bot(s.author.login)
     ]
 
+    _top_contributors_cache.set(cache_key, top_contributors[:top_n])
     return top_contributors[:top_n]
 
 
@@ -57,6 +182,33 @@ def build_github_search_query(
 ) -> str:
     """Builds a GitHub search query string based on the provided parameters."""
 
+    # Normalize to hashable arguments; the query only depends on the dates, so
+    # every search over the same window shares one cached string
+    return _build_search_query(
+        owner,
+        repo,
+        item_type,
+        author,
+        tuple(labels) if labels else (),
+        (created_range[0].date(), created_range[1].date()) if created_range else None,
+        state,
+        min_comments,
+        tuple(extra_terms) if extra_terms else (),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_search_query(
+    owner: str,
+    repo: str,
+    item_type: Optional[str],
+    author: Optional[str],
+    labels: tuple[str, ...],
+    created_range: Optional[tuple[date, date]],
+    state: Optional[str],
+    min_comments: Optional[int],
+    extra_terms: tuple[str, ...],
+) -> str:
     query_parts = [f"repo:{owner}/{repo}"]
 
     # Type filter
@@ -75,44 +227,44 @@ def build_github_search_query(
         query_parts.append(f"author:{author}")
 
     # Label filter
-    if labels:
-        query_parts.extend(f'label:"{label}"' for label in labels)
+    query_parts.extend(f'label:"{label}"' for label in labels)
 
     # Date range filter
     if created_range:
         start, end = created_range
-        query_parts.append(f"created:{start.date()}..{end.date()}")
+        query_parts.append(f"created:{start}..{end}")
 
     # Minimum comments filter
     if min_comments is not None:
         query_parts.append(f"comments:>={min_comments}")
 
     # Additional terms
-    if extra_terms:
-        query_parts.extend(extra_terms)
+    query_parts.extend(extra_terms)
 
     return " ".join(query_parts)
 
 
+# GitHub lists at most this many files for a pull request
+MAX_PR_FILES = 3000
+
+
 async def get_pr_diff(repo: Repository, pull_number: str) -> list[PatchItem]:
-    pr = await asyncio.to_thread(repo.get_pull, int(pull_number))
+    pr = await run_github(repo.get_pull, int(pull_number))
     if not pr:
         raise ValueError(f"Pull request {pull_number} not found")
 
-    files: list[PullRequestFile] = await asyncio.to_thread(lambda: list(pr.get_files()))
-
-    async def get_patch(file: PullRequestFile) -> Optional[PatchItem]:
-        return (
-            await asyncio.to_thread(
-                lambda: PatchItem(file=file.filename, patch=file.patch)
-            )
-            if file.patch
-            else None
-        )
-
-    patches = await asyncio.gather(*(get_patch(f) for f in files))
+    # changed_files comes with the PR, so every page of files can be requested
+    # at once instead of walking the paginator one round-trip at a time
+    paginated_files = pr.get_files()
+    per_page = pr.requester.per_page
+    page_count = -(-min(pr.changed_files, MAX_PR_FILES) // per_page) or 1
+    pages = await asyncio.gather(
+        *(run_github(paginated_files.get_page, page) for page in range(page_count))
+    )
+    files: list[PullRequestFile] = [file for page in pages for file in page]
 
-    return [p for p in patches if p]
+    # Files are already loaded; reading their attributes does no I/O
+    return [PatchItem(file=f.filename, patch=f.patch) for f in files if f.patch]
 
 
 def get_pr_reviews(
@@ -165,29 +317,38 @@ def get_repo(github: Github, owner: str, repo: str) -> Repository:
             raise ValueError(f"GitHub API error: {e.data.get('message', str(e))}")
 
 
-async def fetch_item(
-    repo: Repository, raw: dict[str, object]
-) -> Optional[Union[Issue, PullRequest]]:
+# Results per search request (GitHub's maximum); results are sorted by
+# engagement, so one page is enough to pick each section's top items
+SEARCH_PAGE_SIZE = 100
+
+
+def item_from_search_result(
+    repo: Repository, raw: dict[str, object], headers: dict[str, str | int]
+) -> Optional[Issue]:
+    """
+    Build an Issue from a search API result without fetching it again.
+
+    Search results already carry the full issue payload (comments, reactions,
+    author association, assignees and, for PRs, pull_request.merged_at), so no
+    per-item REST calls are needed.
+    """
     try:
-        item = await asyncio.to_thread(repo.get_issue, int(raw["number"]))
+        item = Issue(repo._requester, headers, raw, completed=True)
 
         # Default merged to None
         merged = None
 
-        # Check if it's a pull request
-        if hasattr(item, "pull_request") and item.pull_request is not None:
-            try:
-                pr = await asyncio.to_thread(repo.get_pull, item.number)
-                merged = await asyncio.to_thread(pr.is_merged)
-            except Exception as e:
-                print(f"⚠️ Failed to determine merged state for PR #{item.number}: {e}")
+        # Pull requests carry merged_at in the issue payload itself, so the
+        # merged state needs no extra get_pull/is_merged round-trips
+        if item.pull_request is not None:
+            merged = item.pull_request.merged_at is not None
 
         setattr(item, "merged", merged)
 
         return item
 
     except Exception as e:
-        print(f"⚠️ Failed to fetch full issue #{raw.get('number')}: {e}")
+        print(f"⚠️ Failed to read search result #{raw.get('number')}: {e}")
         return None
 
 
@@ -200,7 +361,7 @@ async def search_github_items(
     extra_terms: Optional[list[str]] = None,
     author: Optional[str] = None,
     rate_limit_buffer: int = 100,
-) -> list[Union[Issue, PullRequest]]:
+) -> list[Issue]:
     """
     Search GitHub issues and pull requests via the search API.
 
@@ -214,7 +375,8 @@ async def search_github_items(
         rate_limit_buffer: Minimum remaining requests before skipping.
 
     Returns:
-        A deduplicated list of GitHub Issue or PullRequest objects.
+        A deduplicated list of GitHub Issues (pull requests included, with
+        ``merged`` set; see item_from_search_result).
     """
 
     if is_near_rate_limit(github, rate_limit_buffer):
@@ -234,9 +396,13 @@ async def search_github_items(
     print(f"🔍 GitHub search query: {query}")
 
     try:
-        _, data = await asyncio.to_thread(
-            repo._requester.requestJsonAndCheck, "GET", f"/search/issues?q={query}"
+        headers, data = await run_github(
+            repo._requester.requestJsonAndCheck,
+            "GET",
+            "/search/issues",
+            {"q": query, "per_page": SEARCH_PAGE_SIZE},
         )
+        github_throttle.observe(headers)
         items = data.get("items", [])
     except Exception as e:
         from github.GithubException import GithubException
@@ -267,22 +433,21 @@ async def search_github_items(
         print(f"❌ GitHub search failed: {e}")
         raise ValueError(f"Failed to search repository '{repo.full_name}': {str(e)}")
 
-    raw_tasks = [fetch_item(repo, raw) for raw in items]
-    fetched_items = await asyncio.gather(*raw_tasks)
-
-    seen_ids = set()
-    unique_items: list[Union[Issue, PullRequest]] = []
-    for item in fetched_items:
-        if item and item.id not in seen_ids:
-            seen_ids.add(item.id)
-            unique_items.append(item)
+    # Dedupe and drop bot-authored results on the raw payload, before any
+    # Issue objects are built
+    unique_items: dict[object, dict[str, Any]] = {}
+    for raw in items:
+        unique_items.setdefault(raw.get("id"), raw)
 
-    filtered_items: list[Union[Issue, PullRequest]] = []
-    for item in unique_items:
-        user_login = item.user.login if item and item.user else None
+    filtered_items: list[Issue] = []
+    for raw in unique_items.values():
+        user_login = (raw.get("user") or {}).get("login")
         if user_login and is_bot(user_login):
             continue
-        filtered_items.append(item)
+
+        item = item_from_search_result(repo, raw, headers)
+        if item:
+            filtered_items.append(item)
 
     return filtered_items
 
@@ -300,6 +465,9 @@ def get_active_contributors(
     """
 
     commit_counts: defaultdict[str, int] = defaultdict(int)
+    # The commit's author object already has the profile fields we return,
+    # so no separate get_user() call per contributor is needed
+    authors: dict[str, NamedUser] = {}
 
     # GitHub API includes `until` date as exclusive, so we extend it by 1 day
     commits = repo.get_commits(since=since, until=until + timedelta(days=1))
@@ -310,35 +478,31 @@ def get_active_contributors(
             if is_bot(author.login):
                 continue
             commit_counts[author.login] += 1
+            authors.setdefault(author.login, author)
 
     top_usernames = sorted(commit_counts.items(), key=lambda x: x[1], reverse=True)[
         :max_contributors
     ]
 
-    contributors: list[dict[str, str | int]] = []
-
-    for username, count in top_usernames:
-        try:
-            user = github.get_user(username)
-            contributors.append(
-                {
-                    "username": user.login,
-                    "avatar_url": user.avatar_url,
-                    "profile_url": user.html_url,
-                    "commit_count": count,
-                }
-            )
-        except Exception as e:
-            print(f"⚠️ Could not fetch user info for {username}: {e}")
+    contributors: list[dict[str, str | int]] = [
+        {
+            "username": username,
+            "avatar_url": authors[username].avatar_url,
+            "profile_url": authors[username].html_url,
+            "commit_count": count,
+        }
+        for username, count in top_usernames
+    ]
 
     return contributors
 
 
 def score_sort_items(
     repo: Repository,
-    items: list[Union[Issue, PullRequest]],
+    items: list[Issue],
     max_items: int = MAX_ITEMS_PER_SECTION,
-) -> list[tuple[int, Union[Issue, PullRequest]]]:
+    top_contributors: Optional[set[str]] = None,
+) -> list[tuple[int, Issue]]:
     """
     Scores and sorts GitHub issues/PRs based on engagement and author relevance.
 
@@ -346,20 +510,30 @@ def score_sort_items(
     - Base engagement = comments + reactions
     - Bonus for author association (OWNER > MEMBER > COLLABORATOR > CONTRIBUTOR)
     - Bonus for top contributor authors or assignees
-    """
 
-    top_contributors = set(get_top_contributors(repo))
+    Pass ``top_contributors`` when scoring several lists for the same repository
+    so the contributor lookup happens once.
+    """
 
-    def base_engagement(item: Union[Issue, PullRequest]) -> int:
-        reactions = item.raw_data.get("reactions", {}).get("total_count", 0)
-        return int(item.comments) + int(reactions)
+    if top_contributors is None:
+        top_contributors = set(get_top_contributors(repo))
 
-    # Pre-filter top N by engagement to reduce scoring load
-    items_by_engagement = sorted(items, key=base_engagement, reverse=True)[:max_items]
+    # Engagement (comments + reactions) is read once per item
+    engagement = (
+        (
+            int(item.comments)
+            + int(item.raw_data.get("reactions", {}).get("total_count", 0)),
+            item,
+        )
+        for item in items
+    )
 
-    def compute_score(item: Union[Issue, PullRequest]) -> int:
-        score = base_engagement(item)
+    # Pre-filter top N by engagement to reduce scoring load; a bounded heap
+    # avoids sorting every search result just to keep max_items of them
+    by_engagement = heapq.nlargest(max_items, engagement, key=itemgetter(0))
 
+    scored_items: list[tuple[int, Issue]] = []
+    for score, item in by_engagement:
         author = item.user.login if item.user else None
         assoc = item.author_association or ""
 
@@ -370,16 +544,14 @@ def score_sort_items(
         elif assoc == "CONTRIBUTOR":
             score += 3
 
-        if hasattr(item, "assignees"):
-            for assignee in item.assignees:
-                if assignee.login in top_contributors:
-                    score += 3
-
-        return score
+        for assignee in getattr(item, "assignees", None) or ():
+            if assignee.login in top_contributors:
+                score += 3
 
-    scored_items = [(compute_score(item), item) for item in items_by_engagement]
+        scored_items.append((score, item))
 
-    return sorted(scored_items, key=lambda x: x[0], reverse=True)
+    scored_items.sort(key=itemgetter(0), reverse=True)
+    return scored_items
 
 
 async def get_repo_activity(
@@ -389,7 +561,7 @@ async def get_repo_activity(
     start_date: datetime,
     end_date: datetime,
     **kwargs: object,
-) -> list[Union[Issue, PullRequest]]:
+) -> list[Issue]:
     """
     Fetch GitHub pull requests or issues for a given repo and date range,
     prioritizing those with the most engagement.
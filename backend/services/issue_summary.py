@@ -1,17 +1,15 @@
 import asyncio
-import json
 import logging
 from typing import Sequence
 
-from openai import AsyncOpenAI
+import orjson
 
-from config import OPENAI_API_KEY, OPENAI_MODEL
+from config import OPENAI_MODEL
 from models.github import GitHubItem
+from services.openai_client import openai
 
 logger = logging.getLogger(__name__)
 
-openai = AsyncOpenAI(api_key=OPENAI_API_KEY)
-
 PROMPT_ISSUE_SUMMARY = """
 You are an expert TL;DR generator that can summarize GitHub issues and PRs.
 
@@ -23,20 +21,45 @@ Keep it short and engaging, ideally under 50 words.
 Respond in plain text only.
 """.strip()
 
+PROMPT_BATCH_ISSUE_SUMMARY = """
+You are an expert TL;DR generator that can summarize GitHub issues and PRs.
+
+You will receive a JSON array of items, each with an id, title and body.
+For each item, include the following details in its summary:
+- Key points, decisions, and any important context.
+- Any action items or next steps.
+
+Keep each summary short and engaging, ideally under 50 words, in plain text.
+Respond with a JSON object mapping each item's id, as a string, to its summary.
+""".strip()
+
+# Items summarized per OpenAI request, and how many requests may run at once
+ITEMS_PER_REQUEST = 5
+MAX_CONCURRENT_REQUESTS = 8
+
+# Bodies past this are mostly logs and templates (~1500 tokens); summaries are
+# ~50 words, so each one gets a small completion budget
+MAX_BODY_CHARS = 6000
+MAX_SUMMARY_TOKENS = 120
+
+_request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
 
 async def fetch_and_summarize_item(item: GitHubItem) -> GitHubItem:
     context = {
         "title": item.title,
-        "body": item.body or "",
+        "body": (item.body or "")[:MAX_BODY_CHARS],
     }
     try:
-        response = await openai.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": PROMPT_ISSUE_SUMMARY},
-                {"role": "user", "content": json.dumps(context)},
-            ],
-        )
+        async with _request_slots:
+            response = await openai.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": PROMPT_ISSUE_SUMMARY},
+                    {"role": "user", "content": orjson.dumps(context).decode()},
+                ],
+                max_tokens=MAX_SUMMARY_TOKENS,
+            )
         summary = response.choices[0].message.content or ""
     except Exception:
         logger.exception("Failed to summarize item: %s", item.title)
@@ -45,6 +68,66 @@ async def fetch_and_summarize_item(item: GitHubItem) -> GitHubItem:
     return item.model_copy(update={"summary": summary})
 
 
+async def summarize_batch(items: Sequence[GitHubItem]) -> list[GitHubItem]:
+    """Summarize several items with a single OpenAI request."""
+    if len(items) == 1:
+        return [await fetch_and_summarize_item(items[0])]
+
+    context = [
+        {
+            "id": str(item.id),
+            "title": item.title,
+            "body": (item.body or "")[:MAX_BODY_CHARS],
+        }
+        for item in items
+    ]
+    try:
+        async with _request_slots:
+            response = await openai.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": PROMPT_BATCH_ISSUE_SUMMARY},
+                    {"role": "user", "content": orjson.dumps(context).decode()},
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=MAX_SUMMARY_TOKENS * len(items),
+            )
+        summaries = orjson.loads(response.choices[0].message.content or "{}")
+        if not isinstance(summaries, dict):
+            raise ValueError("Expected a JSON object of summaries")
+    except Exception:
+        logger.exception("Failed to summarize batch of %d items", len(items))
+        summaries = {}
+
+    # Items the reply left out (or the whole batch, if the reply was unusable)
+    # are retried one by one, so a bad reply never blanks the entire batch
+    missing = [
+        item for item in items if not isinstance(summaries.get(str(item.id)), str)
+    ]
+    retried = {
+        item.id: item
+        for item in await asyncio.gather(*map(fetch_and_summarize_item, missing))
+    }
+    return [
+        (
+            retried[item.id]
+            if item.id in retried
+            else item.model_copy(update={"summary": summaries[str(item.id)]})
+        )
+        for item in items
+    ]
+
+
 async def summarize_items(items: Sequence[GitHubItem]) -> list[GitHubItem]:
-    tasks = [fetch_and_summarize_item(item) for item in items]
-    return await asyncio.gather(*tasks)
+    """
+    Summarize items in batches of ITEMS_PER_REQUEST, preserving their order.
+
+    Batches run concurrently, but at most MAX_CONCURRENT_REQUESTS OpenAI calls
+    are in flight at once across the process.
+    """
+    batches = [
+        items[start : start + ITEMS_PER_REQUEST]
+        for start in range(0, len(items), ITEMS_PER_REQUEST)
+    ]
+    results = await asyncio.gather(*(summarize_batch(batch) for batch in batches))
+    return [item for batch in results for item in batch]
@@ -0,0 +1,26 @@
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from config import OPENAI_API_KEY
+
+# One OpenAI client (and connection pool) for every service that calls the
+# API, so keep-alive connections are reused across features
+openai = AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    # The SDK retries 429s, 5xx and connection errors with jittered exponential
+    # backoff (honoring Retry-After); allow a few more attempts than the default
+    max_retries=5,
+    http_client=DefaultAsyncHttpxClient(
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        # httpx drops idle connections after 5s by default; calls from one report
+        # are often further apart than that, so keep them warm for a minute
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=100, keepalive_expiry=60
+        ),
+    ),
+)
+
+
+async def close_openai() -> None:
+    """Close the shared OpenAI connection pool (called on app shutdown)."""
+    await openai.close()
@@ -1,11 +1,49 @@
 """Service for generating people/contributor summaries from items."""
-from collections import defaultdict
-from typing import Dict, List, cast
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Dict, List, Optional
 
 from config import MAX_ITEMS_PER_SECTION
-from models.github import GitHubItem
+from models.github import GitHubItem, github_item_list
 from services.tldr_generator import tldr
 
+logger = logging.getLogger(__name__)
+
+# Item summaries are meant to be ~50 words; cap each one so a runaway summary
+# cannot inflate a contributor's TL;DR prompt
+MAX_SUMMARY_CHARS = 400
+
+
+@dataclass(slots=True)
+class _Contributor:
+    """A contributor's profile and their items, while grouping by author."""
+
+    username: str
+    avatar_url: str
+    profile_url: str
+    prs: List[GitHubItem] = field(default_factory=list)
+    issues: List[GitHubItem] = field(default_factory=list)
+
+    @property
+    def total_items(self) -> int:
+        return len(self.prs) + len(self.issues)
+
+
+def _contributor_for(
+    contributors: Dict[str, _Contributor], item: GitHubItem
+) -> _Contributor:
+    """Return the item author's entry, creating it on their first item."""
+    contributor = contributors.get(item.user.login)
+    if contributor is None:
+        contributor = contributors[item.user.login] = _Contributor(
+            username=item.user.login,
+            avatar_url=item.user.avatar_url,
+            profile_url=item.user.html_url,
+        )
+    return contributor
+
 
 async def generate_people_summaries(
     prs: List[GitHubItem],
@@ -32,79 +70,77 @@ async def generate_people_summaries(
         - issues: List of their issues
         - total_items: Total number of contributions
     """
-    # Group items by author
-    contributors: Dict[str, Dict[str, object]] = defaultdict(
-        lambda: {
-            "username": "",
-            "avatar_url": "",
-            "profile_url": "",
-            "prs": [],
-            "issues": [],
-        }
-    )
+    # Group items by author, in first-seen order
+    contributors: Dict[str, _Contributor] = {}
 
     # Add PRs
     for pr in prs:
-        username = pr.user.login
-        if not contributors[username]["username"]:
-            contributors[username]["username"] = username
-            contributors[username]["avatar_url"] = pr.user.avatar_url
-            contributors[username]["profile_url"] = pr.user.html_url
-        contributors[username]["prs"].append(pr)
+        _contributor_for(contributors, pr).prs.append(pr)
 
     # Add issues
     for issue in issues:
-        username = issue.user.login
-        if not contributors[username]["username"]:
-            contributors[username]["username"] = username
-            contributors[username]["avatar_url"] = issue.user.avatar_url
-            contributors[username]["profile_url"] = issue.user.html_url
-        contributors[username]["issues"].append(issue)
-
-    # Generate TL;DR for each contributor
-    people_summaries = []
-
-    for contributor_data in contributors.values():
-        # Combine all their contributions (limit to avoid token limits)
-        all_items = (
-            contributor_data["prs"][:MAX_ITEMS_PER_SECTION]
-            + contributor_data["issues"][:MAX_ITEMS_PER_SECTION]
-        )
+        _contributor_for(contributors, issue).issues.append(issue)
+
+    # Only the 5 most active contributors are returned, so rank them first and
+    # skip TL;DR calls for everyone else (sorted() is stable, so ties keep
+    # their first-seen order)
+    top_contributors = sorted(
+        contributors.values(), key=attrgetter("total_items"), reverse=True
+    )[:5]
+
+    # Serialize every listed item in a single TypeAdapter call, once per id
+    listed = {
+        item.id: item
+        for contributor in top_contributors
+        for item in (*contributor.prs, *contributor.issues)
+    }
+    serialized: Dict[int, Dict[str, object]] = dict(
+        zip(listed, github_item_list.dump_python(list(listed.values()), mode="json"))
+    )
 
-        # Generate TL;DR from their item summaries
-        tldr_text = None
-        if all_items:
-            summaries = [item.summary for item in all_items if item.summary]
-            if summaries:
-                try:
-                    tldr_text = await tldr("\n".join(summaries), stream=False)
-                except Exception as e:
-                    print(
-                        f"Failed to generate TL;DR for {contributor_data['username']}: {e}"
-                    )
-                    tldr_text = None
-
-        people_summaries.append(
-            {
-                "username": contributor_data["username"],
-                "avatar_url": contributor_data["avatar_url"],
-                "profile_url": contributor_data["profile_url"],
-                "tldr": cast(str, tldr_text) if tldr_text else "",
-                "prs": [pr.model_dump(mode="json") for pr in contributor_data["prs"]],
-                "issues": [
-                    issue.model_dump(mode="json")
-                    for issue in contributor_data["issues"]
-                ],
-                "total_items": len(contributor_data["prs"])
-                + len(contributor_data["issues"]),
-            }
+    # Contributors' TL;DRs are independent, so generate them concurrently
+    return await asyncio.gather(
+        *(
+            _summarize_contributor(contributor, serialized)
+            for contributor in top_contributors
         )
+    )
+
+
+async def _summarize_contributor(
+    contributor: _Contributor, serialized: Dict[int, Dict[str, object]]
+) -> Dict[str, object]:
+    """Build one contributor's people-section entry, including their TL;DR."""
+    # Combine all their contributions (limit to avoid token limits)
+    all_items = (
+        contributor.prs[:MAX_ITEMS_PER_SECTION]
+        + contributor.issues[:MAX_ITEMS_PER_SECTION]
+    )
 
-    # Sort by total contributions (most active first) and limit to top 5
-    people_summaries.sort(key=lambda x: x["total_items"], reverse=True)
+    # Generate TL;DR from their item summaries
+    tldr_text: Optional[str] = None
+    joined = "\n".join(
+        item.summary[:MAX_SUMMARY_CHARS] for item in all_items if item.summary
+    )
+    if len(all_items) == 1:
+        # A lone item's summary already is the contributor's TL;DR
+        tldr_text = joined
+    elif joined:
+        try:
+            tldr_text = await tldr(joined, stream=False)
+        except Exception:
+            logger.exception("Failed to generate TL;DR for %s", contributor.username)
+            tldr_text = None
 
-    # Return only the top 5 most active contributors
-    return people_summaries[:5]
+    return {
+        "username": contributor.username,
+        "avatar_url": contributor.avatar_url,
+        "profile_url": contributor.profile_url,
+        "tldr": tldr_text or "",
+        "prs": [serialized[pr.id] for pr in contributor.prs],
+        "issues": [serialized[issue.id] for issue in contributor.issues],
+        "total_items": contributor.total_items,
+    }
 
 
 async def enrich_contributor_with_github_activity(
@@ -135,7 +171,7 @@ async def enrich_contributor_with_github_activity(
     """
     from services.github_client import get_repo_activity
     from services.issue_summary import summarize_items
-    from utils.serializers import serialize_github_item
+    from utils.serializers import serialize_github_items
 
     # Fetch all activity for this contributor
     items = await get_repo_activity(
@@ -147,25 +183,30 @@ async def enrich_contributor_with_github_activity(
         author=contributor["username"],
     )
 
-    github_items = [serialize_github_item(item) for item in items]
-    summarized = await summarize_items(github_items[:MAX_ITEMS_PER_SECTION])
+    github_items = serialize_github_items(items[:MAX_ITEMS_PER_SECTION])
+    summarized = await summarize_items(github_items)
 
     # Generate TL;DR
-    summaries = [item.summary for item in summarized if item.summary]
-    tldr_text = None
-    if summaries:
+    joined = "\n".join(
+        item.summary[:MAX_SUMMARY_CHARS] for item in summarized if item.summary
+    )
+    tldr_text: Optional[str] = None
+    if joined:
         try:
-            tldr_text = await tldr("\n".join(summaries), stream=False)
-        except Exception as e:
-            print(f"Failed to generate TL;DR for {contributor['username']}: {e}")
+            tldr_text = await tldr(joined, stream=False)
+        except Exception:
+            logger.exception("Failed to generate TL;DR for %s", contributor["username"])
+
+    prs: List[GitHubItem] = []
+    issues: List[GitHubItem] = []
+    for item in summarized:
+        (prs if item.is_pull_request else issues).append(item)
 
     return {
         "username": contributor["username"],
         "avatar_url": contributor["avatar_url"],
         "profile_url": contributor["profile_url"],
-        "tldr": cast(str, tldr_text) if tldr_text else "",
-        "prs": [item for item in summarized if getattr(item, "is_pull_request", False)],
-        "issues": [
-            item for item in summarized if not getattr(item, "is_pull_request", False)
-        ],
+        "tldr": tldr_text or "",
+        "prs": prs,
+        "issues": issues,
     }
@@ -1,16 +1,31 @@
+import asyncio
 import logging
-from typing import AsyncGenerator, Union
+from hashlib import blake2b
+from typing import AsyncGenerator, Literal, Union, overload
+from weakref import WeakValueDictionary
 
-from openai import AsyncOpenAI
 from openai.types.chat import (
     ChatCompletionSystemMessageParam,
     ChatCompletionUserMessageParam,
 )
 
-from config import OPENAI_API_KEY, OPENAI_MODEL
+from config import OPENAI_MODEL
+from services.openai_client import openai
+from utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
-openai = AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+# Non-streamed TL;DRs keyed by a hash of the input; the same contributor
+# summaries come back every time a people section is regenerated
+_tldrs: TTLCache[bytes, str] = TTLCache(maxsize=512, ttl=24 * 60 * 60)
+
+# One lock per input so concurrent identical requests reach OpenAI once
+_tldr_locks: "WeakValueDictionary[bytes, asyncio.Lock]" = WeakValueDictionary()
+
+# Non-streamed TL;DR requests allowed in flight at once across the process
+MAX_CONCURRENT_REQUESTS = 8
+
+_request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
 PROMPT_TLDR_SUMMARY = """
 You are an expert TL;DR generator for GitHub repositories.
@@ -30,7 +45,38 @@ Respond in plain text only. Do not use markdown or bullet points.
 """.strip()
 
 
+def _tldr_lock(key: bytes) -> asyncio.Lock:
+    lock = _tldr_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _tldr_locks[key] = lock
+    return lock
+
+
+def _cache_key(text: str) -> bytes:
+    return blake2b(f"{OPENAI_MODEL}\0{text.strip()}".encode(), digest_size=16).digest()
+
+
+async def _empty_stream() -> AsyncGenerator[str, None]:
+    return
+    yield  # unreachable; makes this an async generator
+
+
+@overload
+async def tldr(text: str, stream: Literal[False]) -> str:
+    ...
+
+
+@overload
+async def tldr(text: str, stream: Literal[True] = ...) -> AsyncGenerator[str, None]:
+    ...
+
+
 async def tldr(text: str, stream: bool = True) -> Union[str, AsyncGenerator[str, None]]:
+    # Nothing to summarize: skip the API round-trip
+    if not text.strip():
+        return _empty_stream() if stream else ""
+
     try:
         messages: list[
             ChatCompletionSystemMessageParam | ChatCompletionUserMessageParam
@@ -55,12 +101,27 @@ async def tldr(text: str, stream: bool = True) -> Union[str, AsyncGenerator[str,
             return generator()
 
         else:
-            completion = await openai.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=messages,
-                stream=False,
-            )
-            return completion.choices[0].message.content or ""
+            cache_key = _cache_key(text)
+            cached = _tldrs.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Identical concurrent calls wait for the first one and reuse it
+            async with _tldr_lock(cache_key):
+                cached = _tldrs.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                async with _request_slots:
+                    completion = await openai.chat.completions.create(
+                        model=OPENAI_MODEL,
+                        messages=messages,
+                        stream=False,
+                    )
+                content = completion.choices[0].message.content or ""
+                if content:
+                    _tldrs.set(cache_key, content)
+                return content
 
     except Exception:
         logger.exception("TL;DR generation failed.")
@@ -28,7 +28,7 @@ def make_item(
         updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
         comments=0,
         reactions=0,
-        labels=[],
+        labels=(),
         is_pull_request=is_pr,
         merged=False,
     )
@@ -0,0 +1,58 @@
+import asyncio
+from types import ModuleType, SimpleNamespace
+from typing import Any, Callable, Optional, Protocol, Union
+
+import pytest
+
+
+def completion(content: str) -> SimpleNamespace:
+    """A non-streamed chat completion whose only choice says ``content``."""
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeCompletions:
+    """
+    Stand-in for ``openai.chat.completions`` that records every request.
+
+    ``reply`` is either the completion text or a function of the request
+    kwargs; a function may return text or a ready-made response (a stream).
+    """
+
+    def __init__(self, reply: Union[str, Callable[[dict[str, Any]], Any]] = "") -> None:
+        self.reply = reply
+        self.requests: list[dict[str, Any]] = []
+
+    @property
+    def calls(self) -> int:
+        return len(self.requests)
+
+    async def create(self, **kwargs: Any) -> Any:
+        self.requests.append(kwargs)
+        # Yield once like a real request, so concurrent callers interleave
+        await asyncio.sleep(0)
+        reply = self.reply(kwargs) if callable(self.reply) else self.reply
+        return completion(reply) if isinstance(reply, str) else reply
+
+
+class FakeOpenAI(Protocol):
+    def __call__(
+        self, module: ModuleType, completions: Optional[FakeCompletions] = None
+    ) -> FakeCompletions:
+        ...
+
+
+@pytest.fixture
+def fake_openai(monkeypatch: pytest.MonkeyPatch) -> FakeOpenAI:
+    """Install a FakeCompletions as ``module.openai`` and return it."""
+
+    def install(
+        module: ModuleType, completions: Optional[FakeCompletions] = None
+    ) -> FakeCompletions:
+        fake = completions if completions is not None else FakeCompletions()
+        monkeypatch.setattr(
+            module, "openai", SimpleNamespace(chat=SimpleNamespace(completions=fake))
+        )
+        return fake
+
+    return install
@@ -29,3 +29,12 @@ def test_config_env_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
     for key in overrides:
         monkeypatch.delenv(key, raising=False)
     importlib.reload(config_module)
+
+
+def test_get_settings_is_cached() -> None:
+    import config
+
+    assert config.get_settings() is config.get_settings()
+    assert config.MAX_ITEMS_PER_SECTION == config.get_settings().max_items_per_section
+    assert isinstance(config.COMMON_GITHUB_BOTS, frozenset)
+    assert "codiumai" in config.COMMON_GITHUB_BOTS
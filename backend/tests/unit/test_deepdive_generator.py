@@ -0,0 +1,58 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+
+import pytest
+
+from services import deepdive_generator
+from tests.unit.conftest import FakeCompletions, FakeOpenAI
+
+
+def make_chunk(content: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=SimpleNamespace(content=content))]
+    )
+
+
+def streaming(tokens: list[str]) -> FakeCompletions:
+    def reply(request: dict[str, Any]) -> AsyncIterator[SimpleNamespace]:
+        async def stream() -> AsyncIterator[SimpleNamespace]:
+            for token in tokens:
+                yield make_chunk(token)
+
+        return stream()
+
+    return FakeCompletions(reply)
+
+
+def collect(completions: FakeCompletions, fake_openai: FakeOpenAI) -> list[str]:
+    fake_openai(deepdive_generator, completions)
+
+    async def run() -> list[str]:
+        return [
+            part
+            async for part in deepdive_generator.generate_deep_dive("Title", "x" * 9000)
+        ]
+
+    return asyncio.run(run())
+
+
+def test_generate_deep_dive_coalesces_small_tokens(
+    monkeypatch: pytest.MonkeyPatch, fake_openai: FakeOpenAI
+) -> None:
+    monkeypatch.setattr(deepdive_generator, "STREAM_FLUSH_SECONDS", 60)
+    tokens = ["abcd"] * 100
+
+    parts = collect(streaming(tokens), fake_openai)
+
+    assert "".join(parts) == "abcd" * 100
+    assert [len(part) for part in parts] == [256, 144]
+
+
+def test_generate_deep_dive_truncates_long_bodies(fake_openai: FakeOpenAI) -> None:
+    completions = streaming(["ok"])
+
+    assert collect(completions, fake_openai) == ["ok"]
+    assert '"body":"' + "x" * deepdive_generator.MAX_BODY_CHARS + '"' in (
+        completions.requests[0]["messages"][1]["content"]
+    )
@@ -0,0 +1,101 @@
+import asyncio
+from typing import Any
+
+import orjson
+import pytest
+
+from services import diff_explainer
+from tests.unit.conftest import FakeCompletions, FakeOpenAI
+
+
+@pytest.fixture
+def completions(fake_openai: FakeOpenAI) -> FakeCompletions:
+    diff_explainer._explanations.clear()
+    return fake_openai(diff_explainer, FakeCompletions("Adds retry logic"))
+
+
+def test_explain_diff_reuses_cached_explanations(completions: FakeCompletions) -> None:
+    first = asyncio.run(diff_explainer.explain_diff("app.py", "+retry()"))
+    second = asyncio.run(diff_explainer.explain_diff("app.py", "+retry()"))
+    asyncio.run(diff_explainer.explain_diff("other.py", "+retry()"))
+
+    assert first == second == "Adds retry logic"
+    assert completions.calls == 2
+
+
+def test_explain_diff_does_not_cache_empty_explanations(
+    completions: FakeCompletions,
+) -> None:
+    completions.reply = ""
+
+    asyncio.run(diff_explainer.explain_diff("app.py", "+retry()"))
+    asyncio.run(diff_explainer.explain_diff("app.py", "+retry()"))
+
+    assert completions.calls == 2
+
+
+def explain_each_file(request: dict[str, Any]) -> str:
+    files = [
+        line.removeprefix("File: ")
+        for line in request["messages"][1]["content"].splitlines()
+        if line.startswith("File: ")
+    ]
+    return orjson.dumps({file: f"explains {file}" for file in files}).decode()
+
+
+def test_explain_diffs_groups_files_into_batched_prompts(
+    completions: FakeCompletions,
+) -> None:
+    completions.reply = explain_each_file
+    items = [(f"src/file_{i}.py", f"+line {i}") for i in range(12)]
+
+    explanations = asyncio.run(diff_explainer.explain_diffs(items))
+
+    assert explanations == {file: f"explains {file}" for file, _ in items}
+    batch_sizes = [
+        r["messages"][1]["content"].count("File: ") for r in completions.requests
+    ]
+    assert batch_sizes == [10, 2]
+
+
+def test_explain_diffs_retries_files_missing_from_batch_reply(
+    completions: FakeCompletions,
+) -> None:
+    def rename_second_file(request: dict[str, Any]) -> str:
+        if "response_format" not in request:
+            return "explained alone"
+        return orjson.dumps({"a.py": "explains a.py", "B.PY": "renamed"}).decode()
+
+    completions.reply = rename_second_file
+
+    explanations = asyncio.run(
+        diff_explainer.explain_diffs([("a.py", "+a"), ("b.py", "+b")])
+    )
+
+    assert explanations == {"a.py": "explains a.py", "b.py": "explained alone"}
+    assert completions.calls == 2
+
+
+def test_explain_diffs_caps_concurrent_requests(
+    monkeypatch: pytest.MonkeyPatch, fake_openai: FakeOpenAI
+) -> None:
+    diff_explainer._explanations.clear()
+    in_flight = peak = 0
+
+    class CountingCompletions(FakeCompletions):
+        async def create(self, **kwargs: Any) -> Any:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await super().create(**kwargs)
+            finally:
+                in_flight -= 1
+
+    monkeypatch.setattr(diff_explainer, "_request_slots", asyncio.Semaphore(2))
+    fake_openai(diff_explainer, CountingCompletions(explain_each_file))
+    items = [(f"src/file_{i}.py", f"+line {i}") for i in range(50)]
+
+    asyncio.run(diff_explainer.explain_diffs(items))
+
+    assert peak == 2
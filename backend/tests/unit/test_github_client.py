@@ -1,8 +1,13 @@
 import asyncio
 import types
 from datetime import datetime, timezone
+from typing import Any, cast
 
+import httpx
 import pytest
+from github import Github
+from github.Issue import Issue
+from github.Repository import Repository
 
 from services import github_client
 
@@ -37,12 +42,12 @@ class DummyRepo:
         self.full_name = f"{owner_login}/{name}"
         self._stats: list[DummyStat] = []
         self._commits: list["DummyCommit"] = []
-        self._requester = None
+        self._requester: Any = types.SimpleNamespace(is_lazy=False, is_not_lazy=True)
 
     def get_stats_contributors(self) -> list[DummyStat]:
         return self._stats
 
-    def get_commits(self, since: datetime, until: datetime):
+    def get_commits(self, since: datetime, until: datetime) -> list["DummyCommit"]:
         return self._commits
 
 
@@ -65,14 +70,20 @@ class DummyItem:
         self.user = DummyUser(login)
         self.comments = comments
         self.raw_data = {"reactions": {"total_count": reactions}}
-        self.assignees = []
+        self.assignees: list[DummyUser] = []
         self.author_association = association
 
 
+@pytest.fixture(autouse=True)
+def clear_top_contributors_cache() -> None:
+    github_client._top_contributors_cache.clear()
+
+
 def test_is_bot() -> None:
     assert github_client.is_bot("dependabot[bot]") is True
     assert github_client.is_bot("DePeNdAbOt[BoT]") is True
     assert github_client.is_bot("octocat") is False
+    assert github_client.is_bot("some-new-app[bot]") is True
 
 
 def test_build_github_search_query_variants() -> None:
@@ -104,19 +115,53 @@ def test_is_near_rate_limit() -> None:
         def get_rate_limit(self) -> DummyRateLimit:
             return DummyRateLimit(self._remaining)
 
-    assert github_client.is_near_rate_limit(DummyGithub(99), threshold=100) is True
-    assert github_client.is_near_rate_limit(DummyGithub(150), threshold=100) is False
+    assert (
+        github_client.is_near_rate_limit(cast(Github, DummyGithub(99)), threshold=100)
+        is True
+    )
+    assert (
+        github_client.is_near_rate_limit(cast(Github, DummyGithub(150)), threshold=100)
+        is False
+    )
+
+
+def test_is_near_rate_limit_reuses_recent_reading() -> None:
+    class DummyGithub:
+        calls = 0
+
+        def get_rate_limit(self) -> DummyRateLimit:
+            self.calls += 1
+            return DummyRateLimit(500)
+
+    github = DummyGithub()
+
+    assert github_client.is_near_rate_limit(cast(Github, github)) is False
+    assert github_client.is_near_rate_limit(cast(Github, github)) is False
+    assert github.calls == 1
 
 
 def test_get_top_contributors_skips_bots() -> None:
     repo = DummyRepo()
     repo._stats = [DummyStat("dependabot[bot]", 5), DummyStat("alice", 3)]
 
-    result = github_client.get_top_contributors(repo, top_n=10)
+    result = github_client.get_top_contributors(cast(Repository, repo), top_n=10)
 
     assert result == ["alice"]
 
 
+def test_get_top_contributors_is_cached_per_repository() -> None:
+    repo = DummyRepo()
+    repo._stats = [DummyStat("alice", 3)]
+    assert github_client.get_top_contributors(cast(Repository, repo)) == ["alice"]
+
+    repo._stats = [DummyStat("bob", 9)]
+    assert github_client.get_top_contributors(cast(Repository, repo)) == ["alice"]
+    assert (
+        github_client.get_top_contributors(cast(Repository, DummyRepo(name="other")))
+        == []
+    )
+
+
 def test_get_active_contributors_skips_bot_commits(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -129,17 +174,18 @@ def test_get_active_contributors_skips_bot_commits(
 
     class DummyGithub:
         def get_user(self, username: str) -> DummyUser:
-            return DummyUser(username)
+            raise AssertionError("profile fields come from the commit author")
 
     contributors = github_client.get_active_contributors(
-        DummyGithub(),
-        repo,
+        cast(Github, DummyGithub()),
+        cast(Repository, repo),
         since=datetime.now(timezone.utc),
         until=datetime.now(timezone.utc),
     )
 
     assert [c["username"] for c in contributors] == ["carol"]
     assert contributors[0]["commit_count"] == 2
+    assert contributors[0]["avatar_url"] == "https://github.com/carol.png"
 
 
 def test_score_sort_items_prefers_top_contributors_and_owner(
@@ -155,7 +201,9 @@ def test_score_sort_items_prefers_top_contributors_and_owner(
         item_id=2, login="bob", comments=0, reactions=0, association="OWNER"
     )
 
-    scored = github_client.score_sort_items(repo, [item_owner, item_top])
+    scored = github_client.score_sort_items(
+        cast(Repository, repo), cast(list[Issue], [item_owner, item_top])
+    )
 
     assert [item.user.login for _, item in scored] == ["alice", "bob"]
 
@@ -164,11 +212,19 @@ def test_search_github_items_filters_bots(monkeypatch: pytest.MonkeyPatch) -> No
     repo = DummyRepo(owner_login="octo", name="repo")
 
     class DummyRequester:
-        def requestJsonAndCheck(self, method: str, url: str):
-            return None, {
+        is_lazy = False
+        is_not_lazy = True
+
+        def requestJsonAndCheck(
+            self, method: str, url: str, parameters: dict[str, Any]
+        ) -> tuple[dict[str, str], dict[str, Any]]:
+            assert parameters["per_page"] == github_client.SEARCH_PAGE_SIZE
+            assert parameters["q"].startswith("repo:octo/repo is:pr")
+            return {}, {
                 "items": [
-                    {"number": 1, "id": 10, "user_login": "dependabot[bot]"},
-                    {"number": 2, "id": 11, "user_login": "alice"},
+                    {"number": 1, "id": 10, "user": {"login": "dependabot[bot]"}},
+                    {"number": 2, "id": 11, "user": {"login": "alice"}},
+                    {"number": 2, "id": 11, "user": {"login": "alice"}},
                 ]
             }
 
@@ -178,16 +234,13 @@ def test_search_github_items_filters_bots(monkeypatch: pytest.MonkeyPatch) -> No
         github_client, "is_near_rate_limit", lambda github, threshold=100: False
     )
 
-    async def fake_fetch_item(repo_arg, raw):
-        item = DummyItem(item_id=raw["id"], login=raw["user_login"])
-        return item
-
-    monkeypatch.setattr(github_client, "fetch_item", fake_fetch_item)
-
     results = asyncio.run(
         github_client.search_github_items(
-            github=types.SimpleNamespace(get_rate_limit=lambda: DummyRateLimit(200)),
-            repo=repo,
+            github=cast(
+                Github,
+                types.SimpleNamespace(get_rate_limit=lambda: DummyRateLimit(200)),
+            ),
+            repo=cast(Repository, repo),
             item_type="pr",
             created_range=(datetime(2024, 1, 1), datetime(2024, 1, 2)),
         )
@@ -205,8 +258,8 @@ def test_search_github_items_rate_limit_skip(monkeypatch: pytest.MonkeyPatch) ->
 
     results = asyncio.run(
         github_client.search_github_items(
-            github=types.SimpleNamespace(),
-            repo=repo,
+            github=cast(Github, types.SimpleNamespace()),
+            repo=cast(Repository, repo),
             item_type="pr",
             created_range=(datetime(2024, 1, 1), datetime(2024, 1, 2)),
         )
@@ -218,9 +271,9 @@ def test_search_github_items_rate_limit_skip(monkeypatch: pytest.MonkeyPatch) ->
 def test_get_repo_activity_passes_arguments(monkeypatch: pytest.MonkeyPatch) -> None:
     repo = DummyRepo(owner_login="octo", name="repo")
 
-    captured = {}
+    captured: dict[str, Any] = {}
 
-    async def fake_search_github_items(**kwargs):
+    async def fake_search_github_items(**kwargs: Any) -> list[str]:
         captured.update(kwargs)
         return ["ok"]
 
@@ -228,8 +281,8 @@ def test_get_repo_activity_passes_arguments(monkeypatch: pytest.MonkeyPatch) ->
 
     result = asyncio.run(
         github_client.get_repo_activity(
-            github=types.SimpleNamespace(),
-            repo=repo,
+            github=cast(Github, types.SimpleNamespace()),
+            repo=cast(Repository, repo),
             item_type="pr",
             start_date=datetime(2024, 1, 1),
             end_date=datetime(2024, 1, 2),
@@ -241,3 +294,111 @@ def test_get_repo_activity_passes_arguments(monkeypatch: pytest.MonkeyPatch) ->
     assert captured["author"] == "alice"
     assert captured["item_type"] == "pr"
     assert captured["created_range"] == (datetime(2024, 1, 1), datetime(2024, 1, 2))
+
+
+def test_item_from_search_result_reads_merged_state() -> None:
+    repo = cast(Repository, DummyRepo())
+    merged_pr: dict[str, Any] = {
+        "id": 1,
+        "number": 1,
+        "pull_request": {"merged_at": "2024-01-01T00:00:00Z"},
+        "reactions": {"total_count": 3},
+    }
+    open_pr: dict[str, Any] = {
+        "id": 2,
+        "number": 2,
+        "pull_request": {"merged_at": None},
+    }
+    issue: dict[str, Any] = {"id": 3, "number": 3}
+
+    item = github_client.item_from_search_result(repo, merged_pr, {})
+    assert item is not None
+    assert vars(item)["merged"] is True
+    assert item.raw_data["reactions"]["total_count"] == 3
+
+    open_item = github_client.item_from_search_result(repo, open_pr, {})
+    assert open_item is not None
+    assert vars(open_item)["merged"] is False
+
+    issue_item = github_client.item_from_search_result(repo, issue, {})
+    assert issue_item is not None
+    assert vars(issue_item)["merged"] is None
+
+
+def test_github_throttle_pauses_after_quota_is_exhausted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("services.github_client.time.time", lambda: 1000.0)
+    throttle = github_client.GitHubThrottle(max_concurrency=2)
+
+    throttle.observe({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "1010"})
+    assert throttle._resume_at == 0.0
+
+    throttle.observe({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"})
+    assert throttle._resume_at == 1010.0
+
+    # Retry-After wins, but pauses are capped
+    throttle.observe({"Retry-After": "3600"})
+    assert throttle._resume_at == 1000.0 + throttle.MAX_PAUSE_SECONDS
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("services.github_client.asyncio.sleep", fake_sleep)
+
+    async def call() -> None:
+        async with throttle:
+            pass
+
+    asyncio.run(call())
+    assert sleeps == [throttle.MAX_PAUSE_SECONDS]
+
+
+def test_get_pr_diff_requests_all_file_pages() -> None:
+    requested_pages: list[int] = []
+
+    class DummyFiles:
+        def get_page(self, page: int) -> list[types.SimpleNamespace]:
+            requested_pages.append(page)
+            return [
+                types.SimpleNamespace(filename=f"{page}.py", patch="@@"),
+                types.SimpleNamespace(filename=f"{page}.png", patch=None),
+            ]
+
+    pr = types.SimpleNamespace(
+        changed_files=250,
+        requester=types.SimpleNamespace(per_page=100),
+        get_files=DummyFiles,
+    )
+    repo = types.SimpleNamespace(get_pull=lambda number: pr)
+
+    patches = asyncio.run(github_client.get_pr_diff(cast(Repository, repo), "5"))
+
+    assert sorted(requested_pages) == [0, 1, 2]
+    assert [p.file for p in patches] == ["0.py", "1.py", "2.py"]
+
+
+def test_is_github_token_valid_revalidates_with_etag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    github_client._user_etags.clear()
+    seen_etags: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"abc"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"abc"'}, json={"id": 1})
+
+    async def check_twice() -> list[bool]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            monkeypatch.setattr(github_client, "github_http", client)
+            return [
+                await github_client.is_github_token_valid("token"),
+                await github_client.is_github_token_valid("token"),
+            ]
+
+    assert asyncio.run(check_twice()) == [True, True]
+    assert seen_etags == [None, '"abc"']
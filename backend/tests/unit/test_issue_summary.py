@@ -0,0 +1,80 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import Any
+
+from models.github import GitHubItem, GithubUser
+from services import issue_summary
+from tests.unit.conftest import FakeCompletions, FakeOpenAI
+
+
+def make_item(number: int) -> GitHubItem:
+    return GitHubItem(
+        id=number,
+        number=number,
+        title=f"title-{number}",
+        body="body",
+        user=GithubUser(
+            login="alice",
+            id=1,
+            avatar_url="https://example.com/alice.png",
+            html_url="https://github.com/alice",
+        ),
+        html_url=f"https://github.com/octo/repo/issues/{number}",
+        state="open",
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+        comments=0,
+        reactions=0,
+        is_pull_request=False,
+    )
+
+
+def summaries(request: dict[str, Any]) -> str:
+    payload = json.loads(request["messages"][1]["content"])
+    if isinstance(payload, list):
+        # Leave the last item of each batch out to exercise the fallback
+        return json.dumps({p["id"]: f"summary {p['id']}" for p in payload[:-1]})
+    return f"summary of {payload['title']}"
+
+
+def test_summarize_items_batches_requests_and_keeps_order(
+    fake_openai: FakeOpenAI,
+) -> None:
+    fake = fake_openai(issue_summary, FakeCompletions(summaries))
+    items = [make_item(number) for number in range(1, 7)]
+
+    summarized = asyncio.run(issue_summary.summarize_items(items))
+
+    assert len(fake.requests) == 3
+    assert fake.requests[0]["response_format"] == {"type": "json_object"}
+    assert fake.requests[0]["max_tokens"] == 5 * issue_summary.MAX_SUMMARY_TOKENS
+    assert [item.number for item in summarized] == [1, 2, 3, 4, 5, 6]
+    assert [item.summary for item in summarized] == [
+        "summary 1",
+        "summary 2",
+        "summary 3",
+        "summary 4",
+        "summary of title-5",
+        "summary of title-6",
+    ]
+
+
+def test_summarize_batch_falls_back_per_item_on_bad_reply(
+    fake_openai: FakeOpenAI,
+) -> None:
+    def truncated_batches(request: dict[str, Any]) -> str:
+        if "response_format" in request:
+            return '{"1": "trunc'
+        return summaries(request)
+
+    fake_openai(issue_summary, FakeCompletions(truncated_batches))
+
+    summarized = asyncio.run(
+        issue_summary.summarize_batch([make_item(1), make_item(2)])
+    )
+
+    assert [item.summary for item in summarized] == [
+        "summary of title-1",
+        "summary of title-2",
+    ]
@@ -0,0 +1,51 @@
+import time
+from typing import Any, NoReturn
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.requests import Request
+
+from config import JWT_ALGORITHM, JWT_SECRET
+from middleware import auth
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def make_request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+def test_get_current_user_caches_verified_tokens(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    token = jwt.encode(
+        {
+            "github_token": "gh-token",
+            "user": {"id": 1, "login": "alice"},
+            "exp": int(time.time()) + 3600,
+        },
+        JWT_SECRET,
+        algorithm=JWT_ALGORITHM,
+    )
+
+    first = auth.get_current_user(make_request(), bearer(token))
+    assert first.github_token == "gh-token"
+    assert first.user["login"] == "alice"
+
+    def fail_decode(*args: Any, **kwargs: Any) -> NoReturn:
+        raise AssertionError("token should be served from cache")
+
+    monkeypatch.setattr(auth._jwt, "decode", fail_decode)
+
+    second = auth.get_current_user(make_request(), bearer(token))
+    assert second.user == first.user
+
+
+def test_get_current_user_requires_credentials() -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        auth.get_current_user(make_request(), None)
+    assert exc_info.value.status_code == 401
@@ -26,7 +26,7 @@ def make_item(login: str, summary: str, is_pr: bool, number: int) -> GitHubItem:
         updated_at=datetime.utcnow(),
         comments=0,
         reactions=0,
-        labels=[],
+        labels=(),
         is_pull_request=is_pr,
         merged=False,
     )
@@ -55,6 +55,37 @@ def test_generate_people_summaries_groups_and_sorts(
     assert len(result[0]["prs"]) == 1
     assert len(result[0]["issues"]) == 1
     assert result[1]["username"] == "bob"
+    # Bob's single issue summary is reused instead of generating a TL;DR
+    assert result[1]["tldr"] == "Issue 2"
+
+
+def test_generate_people_summaries_only_summarizes_top_five(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    async def fake_tldr(text: str, stream: bool = True) -> str:
+        calls.append(text)
+        return "TLDR"
+
+    monkeypatch.setattr(people_summary, "tldr", fake_tldr)
+
+    issues = [
+        make_item(f"user{n}", f"summary {n}", False, n * 10 + k)
+        for n in range(7)
+        for k in range(7 - n)
+    ]
+
+    result = asyncio.run(people_summary.generate_people_summaries([], issues))
+
+    assert [person["username"] for person in result] == [
+        "user0",
+        "user1",
+        "user2",
+        "user3",
+        "user4",
+    ]
+    assert len(calls) == 5
 
 
 def test_enrich_contributor_with_github_activity(
@@ -0,0 +1,180 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import Session
+
+from repositories import reports
+from repositories.reports import SECTION_MAX_AGE, ReportsRepository
+
+
+class FakeResult:
+    def __init__(self, row: Any) -> None:
+        self._row = row
+
+    def first(self) -> Any:
+        return self._row
+
+    def scalar_one_or_none(self) -> Any:
+        return self._row
+
+
+class FakeSession:
+    def __init__(self, row: Any) -> None:
+        self.row = row
+        self.executions = 0
+
+    async def execute(self, query: Any) -> FakeResult:
+        self.executions += 1
+        await asyncio.sleep(0)
+        return FakeResult(self.row)
+
+
+@pytest.fixture(autouse=True)
+def clear_section_cache() -> None:
+    reports._section_cache.clear()
+    reports._missing_sections.clear()
+
+
+def test_get_cached_section_reads_database_once_per_key() -> None:
+    session = FakeSession(([{"title": "Fix"}], datetime.now(timezone.utc)))
+    repo = ReportsRepository(session)  # type: ignore[arg-type]
+
+    async def read_concurrently() -> list[Any]:
+        return list(
+            await asyncio.gather(
+                *(repo.get_cached_section(1, "last_week", "prs") for _ in range(5))
+            )
+        )
+
+    results = asyncio.run(read_concurrently())
+
+    assert results == [[{"title": "Fix"}]] * 5
+    assert session.executions == 1
+
+    asyncio.run(repo.get_cached_section(1, "last_week", "prs"))
+    assert session.executions == 1
+
+
+def test_get_cached_section_checks_expiry_on_cached_entries() -> None:
+    stale = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    session = FakeSession(("summary", stale))
+    repo = ReportsRepository(session)  # type: ignore[arg-type]
+
+    assert asyncio.run(repo.get_cached_section(1, "last_day", "tldr")) is None
+    assert (
+        asyncio.run(
+            repo.get_cached_section(1, "last_day", "tldr", skip_expiration_check=True)
+        )
+        == "summary"
+    )
+    assert session.executions == 1
+
+
+def test_get_cached_section_remembers_missing_sections() -> None:
+    session = FakeSession(None)
+    repo = ReportsRepository(session)  # type: ignore[arg-type]
+
+    assert asyncio.run(repo.get_cached_section(1, "last_day", "issues")) is None
+    assert asyncio.run(repo.get_cached_section(1, "last_day", "issues")) is None
+    assert session.executions == 1
+
+    # Reads that accept stale data are not answered by the negative cache
+    asyncio.run(
+        repo.get_cached_section(1, "last_day", "issues", skip_expiration_check=True)
+    )
+    assert session.executions == 2
+
+
+def test_get_cached_section_skips_caching_reads_raced_by_invalidation() -> None:
+    class RacingSession(FakeSession):
+        async def execute(self, query: Any) -> FakeResult:
+            result = await super().execute(query)
+            reports._invalidate_section_cache((1, "last_week", "prs"))
+            return result
+
+    session = RacingSession(([{"title": "Old"}], datetime.now(timezone.utc)))
+    repo = ReportsRepository(session)  # type: ignore[arg-type]
+
+    asyncio.run(repo.get_cached_section(1, "last_week", "prs"))
+    asyncio.run(repo.get_cached_section(1, "last_week", "prs"))
+
+    assert session.executions == 2
+
+
+def test_update_section_invalidates_cache_after_commit() -> None:
+    session = FakeSession(([{"title": "Old"}], datetime.now(timezone.utc)))
+    session.sync_session = Session()  # type: ignore[attr-defined]
+    repo = ReportsRepository(session)  # type: ignore[arg-type]
+    asyncio.run(repo.get_cached_section(1, "last_week", "prs"))
+
+    session.row = SimpleNamespace(repository_id=1, timeframe="last_week")
+    asyncio.run(repo.update_section(5, "prs", [{"title": "New"}]))
+    assert reports._section_cache.get((1, "last_week", "prs")) is not None
+
+    session.sync_session.commit()  # type: ignore[attr-defined]
+    assert reports._section_cache.get((1, "last_week", "prs")) is None
+
+
+def test_update_section_keeps_missing_marker_until_commit() -> None:
+    session = FakeSession(None)
+    session.sync_session = Session()  # type: ignore[attr-defined]
+    repo = ReportsRepository(session)  # type: ignore[arg-type]
+    key = (1, "last_day", "issues")
+
+    asyncio.run(repo.get_cached_section(1, "last_day", "issues"))
+    session.row = SimpleNamespace(repository_id=1, timeframe="last_day")
+    asyncio.run(repo.update_section(5, "issues", []))
+    assert reports._missing_sections.get(key)
+
+    session.sync_session.commit()  # type: ignore[attr-defined]
+    assert reports._missing_sections.get(key) is None
+
+
+class FakePool:
+    def __init__(self, row: Any) -> None:
+        self.row = row
+        self.queries: list[tuple[Any, ...]] = []
+
+    async def fetchrow(self, query: str, *args: Any) -> Any:
+        self.queries.append((query, *args))
+        return self.row
+
+
+def test_get_cached_section_prefers_asyncpg_pool() -> None:
+    session = FakeSession(None)
+    pool = FakePool(("summary", datetime.now(timezone.utc)))
+    repo = ReportsRepository(session, pg_pool=pool)  # type: ignore[arg-type]
+
+    assert asyncio.run(repo.get_cached_section(7, "last_month", "tldr")) == "summary"
+    assert session.executions == 0
+    query, repository_id, timeframe, max_age = pool.queries[0]
+    assert "SELECT tldr_text, tldr_generated_at FROM reports" in query
+    assert "tldr_generated_at >= now() - $3::interval" in query
+    assert (repository_id, timeframe, max_age) == (7, "last_month", SECTION_MAX_AGE)
+
+
+def test_get_cached_section_skips_freshness_filter_when_asked() -> None:
+    pool = FakePool(("summary", datetime(2020, 1, 1, tzinfo=timezone.utc)))
+    repo = ReportsRepository(FakeSession(None), pg_pool=pool)  # type: ignore[arg-type]
+
+    section = asyncio.run(
+        repo.get_cached_section(7, "last_month", "tldr", skip_expiration_check=True)
+    )
+
+    assert section == "summary"
+    query, *args = pool.queries[0]
+    assert "now()" not in query
+    assert args == [7, "last_month"]
+
+
+def test_get_cached_sections_returns_each_section() -> None:
+    pool = FakePool(([{"id": 1}], datetime.now(timezone.utc)))
+    repo = ReportsRepository(FakeSession(None), pg_pool=pool)  # type: ignore[arg-type]
+
+    sections = asyncio.run(repo.get_cached_sections(3, "last_week", ("prs", "issues")))
+
+    assert sections == {"prs": [{"id": 1}], "issues": [{"id": 1}]}
+    assert len(pool.queries) == 2
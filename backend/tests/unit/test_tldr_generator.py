@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from services import tldr_generator
+from tests.unit.conftest import FakeCompletions, FakeOpenAI
+
+
+@pytest.fixture
+def completions(fake_openai: FakeOpenAI) -> FakeCompletions:
+    tldr_generator._tldrs.clear()
+    return fake_openai(tldr_generator, FakeCompletions("Mostly bug fixes"))
+
+
+def test_tldr_reuses_cached_completion(completions: FakeCompletions) -> None:
+    first = asyncio.run(tldr_generator.tldr("Fixes crash", stream=False))
+    second = asyncio.run(tldr_generator.tldr("Fixes crash\n", stream=False))
+    asyncio.run(tldr_generator.tldr("Adds docs", stream=False))
+
+    assert first == second == "Mostly bug fixes"
+    assert completions.calls == 2
+
+
+def test_tldr_skips_api_for_blank_input(completions: FakeCompletions) -> None:
+    async def collect_stream() -> list[str]:
+        stream = await tldr_generator.tldr("  \n", stream=True)
+        return [chunk async for chunk in stream]
+
+    assert asyncio.run(tldr_generator.tldr(" \n ", stream=False)) == ""
+    assert asyncio.run(collect_stream()) == []
+    assert completions.calls == 0
+
+
+def test_tldr_coalesces_concurrent_identical_calls(
+    completions: FakeCompletions,
+) -> None:
+    async def call_concurrently() -> list[str]:
+        return await asyncio.gather(
+            *(tldr_generator.tldr("Fixes crash", stream=False) for _ in range(4))
+        )
+
+    assert asyncio.run(call_concurrently()) == ["Mostly bug fixes"] * 4
+    assert completions.calls == 1
@@ -0,0 +1,56 @@
+import pytest
+
+from utils import cache
+from utils.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(cache, "monotonic", lambda: clock[0])
+
+    ttl_cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=5)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2, ttl=60)
+
+    assert ttl_cache.get("a") == 1
+
+    clock[0] += 10
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    ttl_cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("c") == 3
+
+    ttl_cache.pop("a")
+    assert len(ttl_cache) == 1
+
+
+def test_ttl_cache_reports_values_leaving_the_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(cache, "monotonic", lambda: clock[0])
+    evicted: list[str] = []
+
+    ttl_cache: TTLCache[str, str] = TTLCache(maxsize=2, ttl=5, on_evict=evicted.append)
+    ttl_cache.set("a", "a1")
+    ttl_cache.set("a", "a2")
+    ttl_cache.set("b", "b1")
+    ttl_cache.set("c", "c1")
+    assert evicted == ["a1", "a2"]
+
+    clock[0] += 10
+    assert ttl_cache.get("b") is None
+    ttl_cache.set("d", "d1")
+    ttl_cache.pop("d")
+    ttl_cache.clear()
+    assert evicted == ["a1", "a2", "b1", "d1", "c1"]
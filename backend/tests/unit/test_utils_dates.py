@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Optional, Self
 
 import pytest
 
@@ -9,8 +10,8 @@ class FixedDatetime(datetime):
     """Deterministic datetime for testing."""
 
     @classmethod
-    def now(cls, tz=None):  # type: ignore[override]
-        return datetime(2024, 1, 15, 12, 0, 0, tzinfo=tz or timezone.utc)
+    def now(cls, tz: Optional[tzinfo] = None) -> Self:
+        return cls(2024, 1, 15, 12, 0, 0, tzinfo=tz or timezone.utc)
 
 
 def test_resolve_timeframe_boundaries(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -39,3 +40,20 @@ def test_resolve_timeframe_invalid(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(dates, "datetime", FixedDatetime)
     with pytest.raises(ValueError):
         dates.resolve_timeframe("decade")
+
+
+def test_resolve_timeframe_follows_day_rollover(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(dates, "datetime", FixedDatetime)
+    first_start, _ = dates.resolve_timeframe("last_week")
+
+    class NextDay(FixedDatetime):
+        @classmethod
+        def now(cls, tz: Optional[tzinfo] = None) -> Self:
+            return cls(2024, 1, 16, 0, 0, 1, tzinfo=tz or timezone.utc)
+
+    monkeypatch.setattr(dates, "datetime", NextDay)
+    next_start, _ = dates.resolve_timeframe("last_week")
+
+    assert next_start - first_start == timedelta(days=1)
@@ -0,0 +1,25 @@
+from utils.http_cache import etag_matches, section_cache_headers, section_etag
+
+
+def test_section_etag_is_stable_and_changes_with_data() -> None:
+    etag = section_etag([{"id": 1}])
+
+    assert etag.startswith('W/"')
+    assert etag == section_etag([{"id": 1}])
+    assert etag != section_etag([{"id": 2}])
+
+
+def test_section_cache_headers_always_revalidate() -> None:
+    headers = section_cache_headers('W/"abc"')
+
+    assert headers == {"ETag": 'W/"abc"', "Cache-Control": "private, no-cache"}
+
+
+def test_etag_matches_weak_lists_and_wildcard() -> None:
+    etag = 'W/"abc"'
+
+    assert etag_matches('"xyz", W/"abc"', etag)
+    assert etag_matches('"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"xyz"', etag)
+    assert not etag_matches(None, etag)
@@ -1,11 +1,15 @@
+import sys
 from datetime import datetime, timezone
+from typing import cast
 
-from utils.serializers import serialize_github_item
+from github.Issue import Issue
 
-
-class DummyLabel:
-    def __init__(self, name: str) -> None:
-        self.name = name
+from models.github import github_item_list
+from utils.serializers import (
+    serialize_github_item,
+    serialize_github_items,
+    serialize_user,
+)
 
 
 class DummyUser:
@@ -27,32 +31,75 @@ class DummyItem:
         self.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
         self.updated_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
         self.comments = 5
-        self.labels = [DummyLabel("bug"), DummyLabel("help wanted")]
         self.user = DummyUser("octocat", 99)
-        self.raw_data = {"reactions": {"total_count": 3}}
+        self.raw_data = {
+            "reactions": {"total_count": 3},
+            "labels": [{"name": "bug"}, {"name": "help wanted"}],
+        }
         self.pull_request = object() if is_pr else None
         self.merged = merged
         self.author_association = "CONTRIBUTOR"
 
 
+def dummy_item(is_pr: bool, merged: bool | None = None) -> Issue:
+    return cast(Issue, DummyItem(is_pr, merged))
+
+
 def test_serialize_pull_request() -> None:
-    item = DummyItem(is_pr=True, merged=True)
+    item = dummy_item(is_pr=True, merged=True)
 
     serialized = serialize_github_item(item)
 
     assert serialized.is_pull_request is True
     assert serialized.merged is True
-    assert serialized.labels == ["bug", "help wanted"]
+    assert serialized.labels == ("bug", "help wanted")
     assert serialized.reactions == 3
     assert serialized.user.login == "octocat"
     assert serialized.author_association == "CONTRIBUTOR"
 
 
 def test_serialize_issue_defaults() -> None:
-    item = DummyItem(is_pr=False)
+    item = dummy_item(is_pr=False)
 
     serialized = serialize_github_item(item)
 
     assert serialized.is_pull_request is False
     assert serialized.merged is None
     assert serialized.comments == 5
+
+
+def test_github_item_list_round_trips_cached_json() -> None:
+    items = [serialize_github_item(dummy_item(is_pr=True, merged=True))]
+
+    cached = github_item_list.dump_python(items, mode="json")
+
+    assert cached[0]["created_at"] == "2024-01-01T00:00:00Z"
+    assert github_item_list.validate_python(cached) == items
+
+
+def test_serialize_user_handles_missing_user() -> None:
+    user = serialize_user(None)
+
+    assert user.login == ""
+    assert serialize_user(None) is user
+
+
+def test_cached_items_share_interned_strings() -> None:
+    cached = github_item_list.dump_python(
+        [serialize_github_item(dummy_item(is_pr=False))], mode="json"
+    )
+    cached[0]["state"] = "".join(["op", "en"])
+    cached[0]["user"]["login"] = "".join(["octo", "cat"])
+
+    [item] = github_item_list.validate_python(cached)
+
+    assert item.state is sys.intern("open")
+    assert item.user.login is sys.intern("octocat")
+
+
+def test_serialize_github_items_keeps_order() -> None:
+    items = serialize_github_items(
+        (dummy_item(is_pr=True, merged=True), dummy_item(is_pr=False))
+    )
+
+    assert [item.is_pull_request for item in items] == [True, False]
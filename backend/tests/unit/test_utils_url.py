@@ -17,3 +17,19 @@ def test_parse_repo_url_https() -> None:
 def test_parse_repo_url_invalid() -> None:
     with pytest.raises(ValueError):
         parse_repo_url("not-a-repo")
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://github.com/octocat/hello-world.git",
+        "https://www.github.com/octocat/hello-world/",
+        "github.com/octocat/hello-world",
+        "https://github.com/octocat/hello-world/pull/42",
+        "https://github.com/octocat/hello-world?tab=readme",
+        "https://GitHub.com/octocat/hello-world",
+        "HTTPS://WWW.GITHUB.COM/octocat/hello-world",
+    ],
+)
+def test_parse_repo_url_variants(url: str) -> None:
+    assert parse_repo_url(url) == ("octocat", "hello-world")
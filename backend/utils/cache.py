@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Small in-process LRU cache whose entries expire after ``ttl`` seconds.
+
+    Intended for per-worker memoization of hot reads (the app runs as a single
+    uvicorn process, so there is no cross-process coherence to worry about).
+    Not thread-safe; use it from the event loop only.
+
+    ``on_evict`` is called with every value that leaves the cache (expired,
+    evicted, replaced, popped or cleared), e.g. to release its resources.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        on_evict: Optional[Callable[[V], None]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def _evicted(self, value: V) -> None:
+        if self.on_evict is not None:
+            self.on_evict(value)
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._data[key]
+            self._evicted(value)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        previous = self._data.get(key)
+        self._data[key] = (monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        if previous is not None and previous[1] is not value:
+            self._evicted(previous[1])
+        while len(self._data) > self.maxsize:
+            self._evicted(self._data.popitem(last=False)[1][1])
+
+    def pop(self, key: K) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._evicted(entry[1])
+
+    def clear(self) -> None:
+        values = [value for _, value in self._data.values()]
+        self._data.clear()
+        for value in values:
+            self._evicted(value)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,4 +1,14 @@
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+
+# Timeframe -> number of complete days it covers, ending yesterday
+_TIMEFRAME_SPANS: dict[str, timedelta] = {
+    "last_day": timedelta(days=1),
+    "last_week": timedelta(days=7),
+    "last_month": timedelta(days=30),
+    "last_year": timedelta(days=365),
+}
+_END_OFFSET = timedelta(microseconds=1)
 
 
 def resolve_timeframe(timeframe: str) -> tuple[datetime, datetime]:
@@ -16,29 +26,18 @@ def resolve_timeframe(timeframe: str) -> tuple[datetime, datetime]:
     This ensures reports are cacheable - the same timeframe always means
     the same data, no expiration needed.
     """
-    # Get current date at midnight UTC (start of today)
-    now = datetime.now(timezone.utc)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    if timeframe == "last_day":
-        # Yesterday: from start of yesterday to end of yesterday
-        start = today_start - timedelta(days=1)
-        end = today_start - timedelta(microseconds=1)  # 23:59:59.999999 yesterday
-        return start, end
-    elif timeframe == "last_week":
-        # Last 7 complete days: 7 days ago (00:00:00) to yesterday (23:59:59)
-        start = today_start - timedelta(days=7)
-        end = today_start - timedelta(microseconds=1)
-        return start, end
-    elif timeframe == "last_month":
-        # Last 30 complete days: 30 days ago (00:00:00) to yesterday (23:59:59)
-        start = today_start - timedelta(days=30)
-        end = today_start - timedelta(microseconds=1)
-        return start, end
-    elif timeframe == "last_year":
-        # Last 365 complete days: 365 days ago (00:00:00) to yesterday (23:59:59)
-        start = today_start - timedelta(days=365)
-        end = today_start - timedelta(microseconds=1)
-        return start, end
-    else:
-        raise ValueError(f"Invalid timeframe: {timeframe}")
+    return _timeframe_bounds(timeframe, datetime.now(timezone.utc).date())
+
+
+# Boundaries only move at UTC midnight, so they are computed once per
+# (timeframe, day); the date in the key retires entries on rollover
+@lru_cache(maxsize=16)
+def _timeframe_bounds(timeframe: str, today: date) -> tuple[datetime, datetime]:
+    try:
+        span = _TIMEFRAME_SPANS[timeframe]
+    except KeyError:
+        raise ValueError(f"Invalid timeframe: {timeframe}") from None
+
+    # Every timeframe ends at 23:59:59.999999 yesterday
+    today_start = datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+    return today_start - span, today_start - _END_OFFSET
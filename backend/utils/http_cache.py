@@ -0,0 +1,38 @@
+from hashlib import blake2b
+from typing import Any, Optional
+
+import orjson
+
+
+def section_etag(section_data: Any) -> str:
+    """
+    Weak ETag over stored section data.
+
+    Hashing serializes the whole section, so compute this once when the
+    section is loaded and keep it alongside the data.
+    """
+    digest = blake2b(orjson.dumps(section_data), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def section_cache_headers(etag: str) -> dict[str, str]:
+    """
+    Build ETag and Cache-Control headers for a cached report section.
+
+    Browsers must revalidate on every load (a cheap 304 while the ETag still
+    matches), so a section regenerated through ``force=true`` - a different
+    URL - is picked up by the next plain request.
+    """
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True if an If-None-Match header value matches ``etag``."""
+    if not if_none_match:
+        return False
+    # Weak comparison: W/ prefixes are ignored on both sides
+    bare_etag = etag.removeprefix("W/")
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == bare_etag
+        for candidate in (value.strip() for value in if_none_match.split(","))
+    )
@@ -0,0 +1,27 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def start_log_queue(level: str = "INFO") -> QueueListener:
+    """
+    Route root-logger records through a queue drained by a background thread.
+
+    Handlers that write to stderr run on the listener thread, so logging from a
+    request handler never blocks the event loop on I/O. Call ``stop()`` on the
+    returned listener at shutdown to flush pending records.
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(level.upper())
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
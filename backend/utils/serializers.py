@@ -1,39 +1,72 @@
-from typing import Union
+from typing import Iterable, Optional
 
 from github.Issue import Issue
 from github.NamedUser import NamedUser
-from github.PullRequest import PullRequest
 
-from models.github import GitHubItem, GithubUser
+from models.github import GitHubItem, GithubUser, intern_labels, intern_optional
 
+# PyGithub objects are already typed, so the models are built with
+# model_construct() and skip validation; the interning the validators would
+# do is applied here instead
 
-def serialize_user(user: NamedUser) -> GithubUser:
+# Stand-in for items whose author is missing, shared rather than rebuilt
+_ANONYMOUS_USER = GithubUser.model_construct(login="", id=0, avatar_url="", html_url="")
+
+
+def serialize_user(user: Optional[NamedUser]) -> GithubUser:
     if user is None:
-        return {}
+        return _ANONYMOUS_USER
 
-    return GithubUser(
-        login=user.login,
+    return GithubUser.model_construct(
+        login=intern_optional(user.login),
         id=user.id,
         avatar_url=user.avatar_url,
         html_url=user.html_url,
     )
 
 
-def serialize_github_item(item: Union[Issue, PullRequest]) -> GitHubItem:
-    return GitHubItem(
-        id=item.id,
-        number=item.number,
-        title=item.title,
-        body=item.body or "",
-        html_url=item.html_url,
-        state=item.state,
-        created_at=item.created_at,
-        updated_at=item.updated_at,
-        comments=item.comments,
-        labels=[label.name for label in item.labels],
-        user=serialize_user(item.user),
-        reactions=item.raw_data.get("reactions", {}).get("total_count", 0),
-        is_pull_request=hasattr(item, "pull_request") and item.pull_request is not None,
-        merged=getattr(item, "merged", False),
-        author_association=getattr(item, "author_association", None),
-    )
+def _merged(item: Issue) -> Optional[bool]:
+    # Set by item_from_search_result(); PyGithub's Issue has no such field
+    merged: Optional[bool] = vars(item).get("merged")
+    return merged
+
+
+def serialize_github_item(item: Issue) -> GitHubItem:
+    return serialize_github_items((item,))[0]
+
+
+def serialize_github_items(items: Iterable[Issue]) -> list[GitHubItem]:
+    """
+    Serialize a batch of items in one loop.
+
+    Items come from item_from_search_result(): completed Issues with
+    ``merged`` already set, so plain attribute access never hits the network.
+    """
+    construct_item = GitHubItem.model_construct
+    serialized: list[GitHubItem] = []
+    append = serialized.append
+    for item in items:
+        raw = item.raw_data
+        reactions = raw.get("reactions")
+        append(
+            construct_item(
+                id=item.id,
+                number=item.number,
+                title=item.title,
+                body=item.body or "",
+                html_url=item.html_url,
+                state=intern_optional(item.state),
+                created_at=item.created_at,
+                updated_at=item.updated_at,
+                comments=item.comments,
+                labels=intern_labels(
+                    label["name"] for label in raw.get("labels") or ()
+                ),
+                user=serialize_user(item.user),
+                reactions=reactions.get("total_count", 0) if reactions else 0,
+                is_pull_request=item.pull_request is not None,
+                merged=_merged(item),
+                author_association=intern_optional(item.author_association),
+            )
+        )
+    return serialized
@@ -1,9 +1,19 @@
-from urllib.parse import urlparse
+import re
+from functools import lru_cache
 
+# owner/repo, optionally prefixed by a github.com URL and followed by a ".git"
+# suffix or any trailing path/query (e.g. ".../pulls/42", "?tab=readme").
+# Scheme and host match case-insensitively, like URLs do.
+_REPO_URL_RE = re.compile(
+    r"^(?:(?i:(?:https?://)?(?:www\.)?github\.com)/)?"
+    r"([^/\s?#]+)/([^/\s?#]+?)(?:\.git)?(?:[/?#].*)?$"
+)
 
+
+# The same handful of repositories is parsed on every request
+@lru_cache(maxsize=1024)
 def parse_repo_url(url: str) -> tuple[str, str]:
-    parsed = urlparse(str(url))
-    parts = parsed.path.strip("/").split("/")
-    if len(parts) >= 2:
-        return parts[0], parts[1]
+    match = _REPO_URL_RE.match(str(url).strip())
+    if match:
+        return match.group(1), match.group(2)
     raise ValueError("Invalid GitHub repository URL")